@@ -0,0 +1,486 @@
+"""CLI implementation for Code Reporter.
+
+Kept separate from ``cli.py`` so that ``--help`` and shell completion only
+pay for importing Click; dotenv, logging and the analysis modules are
+loaded here once a run actually starts.
+"""
+
+import io
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, Optional
+
+from dotenv import dotenv_values, find_dotenv
+
+from .logger import init_logger, get_logger
+
+# Upper bound on repositories analyzed concurrently; most of the per-repo time
+# is spent waiting on GitHub/Sentry/OSV requests and subprocesses.
+MAX_WORKERS = 16
+
+# Accepted repository URL prefixes (str.startswith takes the tuple directly)
+_GITHUB_URL_PREFIXES = ('https://github.com/', 'git@github.com:')
+
+
+def run(
+    repo_list_file: Path,
+    output_dir: Path,
+    format: str,
+    env_file: Optional[Path],
+    verbose: bool,
+    llm: str,
+    machine: bool,
+    cache_ttl: int = 0
+) -> None:
+    """Analyze GitHub repositories and generate comprehensive reports."""
+    
+    # Load environment variables
+    if env_file and env_file.exists():
+        _load_env_cached(env_file)
+    else:
+        found = find_dotenv()  # Load from .env if it exists
+        if found:
+            _load_env_cached(Path(found))
+    
+    # Initialize logging
+    init_logger(verbose)
+    logger = get_logger()
+    
+    # Importing the report stack (plotly, pandas, litellm) takes a while;
+    # do it in the background while repositories are cloned and analyzed.
+    preload_thread = threading.Thread(target=_preload_report_generator, daemon=True)
+    preload_thread.start()
+    
+    # Validate configuration
+    config = validate_config(verbose)
+    if not config:
+        sys.exit(1)
+    
+    # Create output directory
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    logger.debug(f"Repository list: {repo_list_file}")
+    logger.debug(f"Output directory: {output_dir}")
+    logger.debug(f"Report format: {format}")
+    
+    # Import analysis modules
+    from .repo_manager import RepositoryManager
+    from .language_detector import LanguageDetector
+    from .github_analyzer import GitHubAnalyzer
+    from .dependency_analyzer import DependencyAnalyzer
+    from .sentry_analyzer import SentryAnalyzer
+    from .scc_analyzer import SCCAnalyzer
+    from .readme_parser import ReadmeParser
+    from ._http_cache import create_result_cache, create_session
+    
+    logger.info("Starting repository analysis")
+    
+    # Read repository list
+    repos = read_repo_list(repo_list_file)
+    logger.info(f"Found {len(repos)} repositories to analyze")
+    
+    for repo in repos:
+        logger.debug(f"Repository: {repo}")
+    
+    # Initialize managers
+    repo_manager = RepositoryManager(github_token=config['github_token'])
+    language_detector = LanguageDetector()
+    github_analyzer = GitHubAnalyzer()
+    # Separate sessions share one on-disk cache without sharing auth headers
+    dependency_analyzer = DependencyAnalyzer(
+        session=create_session(output_dir, cache_ttl),
+        result_cache=create_result_cache(output_dir, cache_ttl)
+    )
+    sentry_analyzer = SentryAnalyzer(
+        auth_token=config['sentry']['auth_token'],
+        organization_slug=config['sentry']['org_slug'],
+        session=create_session(output_dir, cache_ttl)
+    )
+    scc_analyzer = SCCAnalyzer()
+    readme_parser = ReadmeParser()
+    
+    # Analyze repositories
+    analysis_results = {}
+    
+    def progress_callback(message: str) -> None:
+        logger.debug(message)
+    
+    analyzers = (
+        language_detector, dependency_analyzer, github_analyzer,
+        sentry_analyzer, scc_analyzer, readme_parser, logger
+    )
+    
+    try:
+        # Clone repositories one by one and hand each to the pool as soon as
+        # it lands, so analysis overlaps with the remaining clones.
+        completed = {}
+        successful = 0
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(repos)))) as pool:
+                try:
+                    futures = []
+                    for repo_info in repo_manager.clone_repositories_streaming(repos, progress_callback):
+                        if not repo_info.success:
+                            logger.info(f"Failed to clone {repo_info.full_name}: {repo_info.error}")
+                            completed[repo_info.url] = {
+                                'success': False,
+                                'error': repo_info.error,
+                                'repo_info': repo_info
+                            }
+                            continue
+                        futures.append(pool.submit(_analyze_one, repo_info.url, repo_info, *analyzers))
+                    
+                    for future in as_completed(futures):
+                        repo_url, result = future.result()
+                        completed[repo_url] = result
+                        if result['success']:
+                            successful += 1
+                except KeyboardInterrupt:
+                    # Drop queued analyses so leaving the block only waits for
+                    # the ones already running, not the rest of the batch
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+        finally:
+            repo_manager.cleanup()
+        
+        # Keep results in repo-list order for the reports
+        for repo_url in repos:
+            if repo_url in completed:
+                analysis_results[repo_url] = completed[repo_url]
+    
+    except KeyboardInterrupt:
+        logger = get_logger()
+        logger.warning("Analysis interrupted by user")
+        return
+    
+    # Summary
+    logger.debug(f"Analysis complete: {successful}/{len(repos)} repositories successful")
+    
+    # Generate reports if we have successful analyses
+    if successful > 0:
+        logger.debug("Generating reports")
+        logger.debug("Generating LLM-powered executive summary")
+        logger.debug(f"Using model: {llm}")
+        
+        preload_thread.join()
+        from .report_generator import ReportGenerator
+        
+        report_generator = ReportGenerator(output_dir, llm_model=llm)
+        report_paths = report_generator.generate_reports(analysis_results, format, machine=machine)
+        
+        logger.debug("Reports generated:")
+        for report_type, path in report_paths.items():
+            if report_type == 'executive_summary':
+                logger.debug(f"Executive Summary: {path}")
+            elif report_type == 'combined_report':
+                logger.debug(f"Combined Report: {path}")
+            elif report_type == 'machine_json':
+                logger.debug(f"Machine JSON: {path}")
+            else:
+                logger.debug(f"Project Report ({report_type.replace('https://github.com/', '')}): {path}")
+        
+        logger.info(f"All reports saved to: {output_dir}")
+
+
+def _preload_report_generator() -> None:
+    """Import the report generator module ahead of time."""
+    try:
+        from . import report_generator  # noqa: F401
+    except Exception:
+        # Let the real import in run() surface the error
+        pass
+
+
+class _ReportBuffer:
+    """Collect one repository's display lines and emit them as a single log record."""
+    
+    def __init__(self, logger):
+        self.logger = logger
+        self._buffer = io.StringIO()
+    
+    def __enter__(self) -> '_ReportBuffer':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        text = self._buffer.getvalue().rstrip('\n')
+        if text:
+            self.logger.debug(text)
+    
+    def write(self, message: str):
+        """Append a line to the buffered output."""
+        self._buffer.write(message)
+        self._buffer.write('\n')
+
+
+def _language_lines(r: dict) -> Iterator[str]:
+    """Primary language, version and frameworks."""
+    language_info = r['language_info']
+    primary_name = language_info['primary_language']
+    primary = language_info['languages'][primary_name]
+    yield f"Primary language: {primary_name.title()}"
+    version = primary.get('version')
+    if version:
+        yield f"Language version: {version}"
+    for framework, info in (primary.get('frameworks') or {}).items():
+        version_info = f" (v{info['version']})" if info['version'] != 'unknown' else ""
+        yield f"Framework: {framework.title()}{version_info}"
+
+
+def _github_lines(r: dict) -> Iterator[str]:
+    """GitHub metadata, issue and commit activity."""
+    stats = r['github_stats']
+    metadata, issues, commits = stats['metadata'], stats['issues'], stats['commits']
+    past_issues = issues['past_month']
+    past_commits = commits['past_month']
+    avg_resolution = issues.get('avg_resolution_time')
+    top_contributors = commits['top_contributors']
+    yield f"GitHub stats: {metadata.get('stars', 0)} stars, {metadata.get('forks', 0)} forks"
+    license_name = metadata.get('license')
+    if license_name:
+        yield f"License: {license_name}"
+    yield f"Issues (past month): {past_issues['created']} created, {past_issues['resolved']} resolved"
+    if avg_resolution and avg_resolution.get('days', 0) > 0:
+        yield f"Average issue resolution time: {avg_resolution['days']} days"
+    yield f"Commits (past month): {past_commits['total']} commits by {past_commits['unique_authors']} authors"
+    if top_contributors:
+        top = top_contributors[0]
+        yield f"Top contributor: {top['name']} ({top['commits']} commits)"
+
+
+def _dependency_lines(r: dict) -> Iterator[str]:
+    """Dependency counts and vulnerability highlights."""
+    dependency_info = r['dependency_info']
+    summary = dependency_info['summary']
+    yield f"Dependencies: {summary['total_dependencies']} total"
+    if summary['vulnerable_packages'] > 0:
+        yield f"Security alerts: {summary['vulnerable_packages']} vulnerable packages"
+        for vuln in dependency_info['vulnerabilities'][:3]:  # Show first 3
+            yield f"Vulnerability: {vuln['package']} v{vuln['version']}: {vuln['vulnerability']['summary'][:60]}..."
+    else:
+        yield "Security: No known vulnerabilities found"
+    for lang, lang_deps in dependency_info['dependencies'].items():
+        if lang_deps.get('detected'):
+            pkg_count = len(lang_deps.get('packages', {}))
+            dev_count = len(lang_deps.get('dev_packages', {}))
+            if pkg_count > 0:
+                yield f"{lang.title()} dependencies: {pkg_count} packages" + (f", {dev_count} dev" if dev_count else "")
+
+
+def _sentry_lines(r: dict) -> Iterator[str]:
+    """Sentry error statistics."""
+    sentry_stats = r['sentry_stats']
+    if not sentry_stats['success']:
+        yield f"Sentry analysis failed: {sentry_stats.get('error', 'Analysis failed')}"
+        return
+    sentry_issues = sentry_stats['issues']
+    past_month = sentry_issues['past_month']
+    avg_days = sentry_issues['avg_resolution_time']['days']
+    events_count = sentry_issues['events_count']
+    if past_month['total'] > 0:
+        yield f"Sentry errors (past month): {past_month['total']} total, {past_month['resolved']} resolved"
+        if avg_days > 0:
+            yield f"Average Sentry resolution time: {avg_days} days"
+        if events_count > 0:
+            yield f"Sentry event volume: {events_count} events"
+    else:
+        yield "Sentry: No errors in past month"
+    projects = sentry_stats.get('projects')
+    if projects:
+        yield f"Sentry projects: {', '.join(p['name'] for p in projects)}"
+
+
+def _scc_lines(r: dict) -> Iterator[str]:
+    """SCC code metrics and COCOMO estimates."""
+    scc_stats = r['scc_stats']
+    if not scc_stats['success']:
+        yield f"SCC analysis failed: {scc_stats.get('error', 'Analysis failed')}"
+        return
+    totals = scc_stats['totals']
+    yield f"Code metrics: {totals['lines']} total lines, {totals['files']} files"
+    if scc_stats['estimated_cost'] > 0:
+        scc_analyzer = r['scc_analyzer']
+        cost = scc_analyzer.format_cost(scc_stats['estimated_cost'])
+        schedule = scc_analyzer.format_schedule(scc_stats['estimated_schedule_months'])
+        yield f"COCOMO estimates: {cost}, {schedule}"
+
+
+# Verbose per-repository summary: (applies to result?, line formatter) pairs,
+# rendered in order by _analyze_one.
+DISPLAY_SECTIONS = [
+    (lambda r: bool(r['language_info']['primary_language']), _language_lines),
+    (lambda r: r['github_stats']['success'], _github_lines),
+    (lambda r: True, _dependency_lines),
+    (lambda r: r['sentry_enabled'], _sentry_lines),
+    (lambda r: r['scc_analyzer'].enabled, _scc_lines),
+]
+
+
+def _analyze_one(
+    repo_url: str,
+    repo_info,
+    language_detector,
+    dependency_analyzer,
+    github_analyzer,
+    sentry_analyzer,
+    scc_analyzer,
+    readme_parser,
+    logger
+) -> tuple[str, dict]:
+    """Run every analyzer against one cloned repository.
+
+    Called from worker threads, so progress goes through the logger rather
+    than click.echo.
+    """
+    logger.info(f"Analyzing {repo_info.full_name}")
+    
+    try:
+        # Detect languages and frameworks
+        language_info = language_detector.analyze_repository(repo_info.local_path)
+
+        # Parse README for project description
+        readme_info = readme_parser.parse_repository(repo_info.local_path)
+
+        # Analyze dependencies and vulnerabilities
+        dependency_info = dependency_analyzer.analyze_repository(repo_info.local_path, language_info)
+
+        # Analyze GitHub statistics (pass local path for full-branch commit stats)
+        github_stats = github_analyzer.analyze_repository(
+            repo_info.owner, repo_info.name, repo_info.local_path
+        )
+
+        # Analyze Sentry error data
+        logger.debug(f"Calling Sentry analyzer for {repo_info.owner}/{repo_info.name}")
+        sentry_stats = sentry_analyzer.analyze_repository(repo_info.owner, repo_info.name)
+        if logger.is_debug_enabled():
+            logger.debug(f"Sentry analysis result: success={sentry_stats.get('success', False)}, projects={len(sentry_stats.get('projects', []))}")
+
+        # Analyze code metrics with SCC
+        logger.debug(f"Calling SCC analyzer for {repo_info.owner}/{repo_info.name}")
+        scc_stats = scc_analyzer.analyze_repository(repo_info.local_path)
+        if logger.is_debug_enabled():
+            logger.debug(f"SCC analysis result: success={scc_stats.get('success', False)}, lines={scc_stats.get('totals', {}).get('lines', 0)}")
+
+        result = {
+            'success': True,
+            'repo_info': repo_info,
+            'language_info': language_info,
+            'readme_info': readme_info,
+            'github_stats': github_stats,
+            'dependency_info': dependency_info,
+            'sentry_stats': sentry_stats,
+            'scc_stats': scc_stats
+        }
+
+        # Display results (verbose only), buffered so concurrent workers don't interleave lines
+        if logger.is_debug_enabled():
+            view = {**result, 'sentry_enabled': sentry_analyzer.enabled, 'scc_analyzer': scc_analyzer}
+            with _ReportBuffer(logger) as buf:
+                buf.write(f"Results for {repo_info.full_name}:")
+                for applies, format_lines in DISPLAY_SECTIONS:
+                    if applies(view):
+                        for line in format_lines(view):
+                            buf.write(line)
+
+        return repo_url, result
+
+    except Exception as e:
+        logger.info(f"Analysis failed for {repo_info.full_name}: {str(e)}")
+        return repo_url, {
+            'success': False,
+            'error': str(e),
+            'repo_info': repo_info
+        }
+
+
+@lru_cache(maxsize=8)
+def _read_env_file(path: str, mtime_ns: int) -> dict[str, Optional[str]]:
+    """Parse a .env file; cached per path and modification time."""
+    return dotenv_values(path)
+
+
+def _load_env_cached(path: Path) -> None:
+    """Load a .env file into os.environ without overriding existing values.
+
+    Parsed contents are reused while the file is unchanged; call
+    ``_read_env_file.cache_clear()`` to force a re-read.
+    """
+    values = _read_env_file(str(path), path.stat().st_mtime_ns)
+    os.environ.update({
+        key: value for key, value in values.items()
+        if value is not None and key not in os.environ
+    })
+
+
+def validate_config(verbose: bool = False) -> Optional[dict]:
+    """Validate required configuration and environment variables."""
+    config = {}
+    errors = []
+    env = os.environ
+    
+    # Check for LLM API keys (at least one required)
+    openai_key = env.get('OPENAI_API_KEY')
+    anthropic_key = env.get('ANTHROPIC_API_KEY')
+    
+    if not openai_key and not anthropic_key:
+        errors.append("Either OPENAI_API_KEY or ANTHROPIC_API_KEY must be set")
+    
+    config['llm_api_keys'] = {
+        'openai': openai_key,
+        'anthropic': anthropic_key
+    }
+    
+    # Optional Sentry configuration
+    config['sentry'] = {
+        'client_key': env.get('SENTRY_CLIENT_KEY'),
+        'auth_token': env.get('SENTRY_AUTH_TOKEN'),
+        'org_slug': env.get('SENTRY_ORG_SLUG')
+    }
+    
+    # Optional GitHub token for private repos
+    config['github_token'] = env.get('GITHUB_TOKEN')
+    
+    if verbose:
+        logger = get_logger()
+        logger.debug("Configuration status:")
+        logger.debug(f"  OpenAI API Key: {'✅' if openai_key else '❌'}")
+        logger.debug(f"  Anthropic API Key: {'✅' if anthropic_key else '❌'}")
+        logger.debug(f"  GitHub Token: {'✅' if config['github_token'] else '❌'}")
+        logger.debug(f"  Sentry Client Key: {'✅' if config['sentry']['client_key'] else '❌'}")
+        logger.debug(f"  Sentry Auth Token: {'✅' if config['sentry']['auth_token'] else '❌'}")
+        logger.debug(f"  Sentry Org Slug: {'✅' if config['sentry']['org_slug'] else '❌'}")
+    
+    if errors:
+        logger = get_logger()
+        logger.error("Configuration errors:")
+        for error in errors:
+            logger.error(f"  - {error}")
+        return None
+    
+    return config
+
+
+def read_repo_list(file_path: Path) -> list[str]:
+    """Read repository URLs from file, one per line."""
+    repos = []
+    warnings = []
+    
+    text = file_path.read_text(encoding='utf-8', errors='replace')
+    for line_num, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line[0] == '#':
+            continue
+        # Basic URL validation
+        if not line.startswith(_GITHUB_URL_PREFIXES):
+            warnings.append(f"Line {line_num} doesn't look like a GitHub URL: {line}")
+        repos.append(line)
+    
+    if warnings:
+        logger = get_logger()
+        logger.warning('\n'.join(warnings))
+    
+    return repos
+
@@ -0,0 +1,181 @@
+"""Optional on-disk caches for HTTP API responses and derived results.
+
+HTTP caching is backed by ``requests-cache`` when it is installed; otherwise
+``create_session`` falls back to a plain ``requests.Session``. Derived results
+(e.g. normalized OSV findings) go in a stdlib ``sqlite3`` store. Caching is
+purely an optimisation for repeated report runs.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import __version__
+from ._json import dumps as json_dumps, loads as json_loads
+from .logger import get_logger
+
+# SQLite cache files created inside the report output directory
+CACHE_NAME = '.http_cache'
+RESULTS_NAME = '.result_cache.sqlite'
+
+# Connections kept per host. The pool blocks when exhausted, so this also caps
+# concurrent requests per host across all analysis threads.
+POOL_SIZE = 16
+
+# Packagist and PyPI ask API clients to identify themselves
+USER_AGENT = f'code-reporter/{__version__}'
+
+
+def create_session(cache_dir: Optional[Path] = None, expire_after: int = 0) -> requests.Session:
+    """
+    Create a requests session, cached on disk when enabled.
+
+    Args:
+        cache_dir: Directory holding the SQLite cache file
+        expire_after: Cache lifetime in seconds; 0 disables caching
+
+    Returns:
+        A CachedSession when caching is enabled and available, else a plain Session;
+        either way with a pooled adapter that retries transient failures
+    """
+    if cache_dir is None or expire_after <= 0:
+        return _mount_adapter(requests.Session())
+
+    try:
+        import requests_cache
+    except ImportError:
+        logger = get_logger()
+        logger.debug("requests-cache not installed; HTTP response caching disabled")
+        return _mount_adapter(requests.Session())
+
+    # Responses are keyed by method + full URL (including query params);
+    # stale entries are revalidated with ETag/Last-Modified when available.
+    return _mount_adapter(requests_cache.CachedSession(
+        str(cache_dir / CACHE_NAME),
+        backend='sqlite',
+        expire_after=expire_after,
+        allowable_codes=(200,),
+    ))
+
+
+def _mount_adapter(session: requests.Session) -> requests.Session:
+    """Mount a pooled adapter that retries rate limits and gateway errors."""
+    session.headers['User-Agent'] = USER_AGENT
+    # Backs off exponentially and honours Retry-After; the final response is
+    # returned (not raised) once retries run out, so callers still see the status.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({'GET', 'POST'}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        pool_block=True,
+        max_retries=retry,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class ResultCache:
+    """
+    SQLite key/value store for derived API results, with a fixed lifetime.
+
+    Covers lookups the HTTP cache can't, such as per-package findings taken
+    from POST batch queries, and registry license answers (which also spares
+    re-parsing large PyPI documents). Safe to share between threads.
+    """
+
+    def __init__(self, path: Path, expire_after: int):
+        self._expire_after = expire_after
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        # WAL lets concurrent report runs read while another writes
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS results '
+            '(key TEXT PRIMARY KEY, payload BLOB NOT NULL, ts INTEGER NOT NULL)'
+        )
+        self._conn.commit()
+        self.purge()
+
+    def purge(self) -> None:
+        """Delete expired entries so the file doesn't grow without bound."""
+        cutoff = int(time.time()) - self._expire_after
+        try:
+            with self._lock:
+                self._conn.execute('DELETE FROM results WHERE ts < ?', (cutoff,))
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger = get_logger()
+            logger.debug(f"Result cache purge failed: {e}")
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return the unexpired entries among keys; missing keys are omitted."""
+        keys = list(keys)
+        found: Dict[str, Any] = {}
+        if not keys:
+            return found
+        cutoff = int(time.time()) - self._expire_after
+        try:
+            with self._lock:
+                # Stay under SQLite's bound-parameter limit
+                for i in range(0, len(keys), 500):
+                    batch = keys[i:i + 500]
+                    rows = self._conn.execute(
+                        f"SELECT key, payload FROM results WHERE ts >= ? AND key IN ({','.join('?' * len(batch))})",
+                        (cutoff, *batch),
+                    ).fetchall()
+                    for key, payload in rows:
+                        found[key] = json_loads(payload)
+        except (sqlite3.Error, ValueError) as e:
+            logger = get_logger()
+            logger.debug(f"Result cache read failed: {e}")
+        return found
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Store or refresh entries."""
+        if not items:
+            return
+        now = int(time.time())
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO results (key, payload, ts) VALUES (?, ?, ?)',
+                    [(key, json_dumps(value), now) for key, value in items.items()],
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger = get_logger()
+            logger.debug(f"Result cache write failed: {e}")
+
+
+def create_result_cache(cache_dir: Optional[Path] = None, expire_after: int = 0) -> Optional[ResultCache]:
+    """
+    Open the on-disk result cache.
+
+    Args:
+        cache_dir: Directory holding the SQLite file
+        expire_after: Entry lifetime in seconds; 0 disables caching
+
+    Returns:
+        A ResultCache, or None when caching is disabled or the file can't be opened
+    """
+    if cache_dir is None or expire_after <= 0:
+        return None
+    try:
+        return ResultCache(cache_dir / RESULTS_NAME, expire_after)
+    except sqlite3.Error as e:
+        logger = get_logger()
+        logger.debug(f"Result cache unavailable: {e}")
+        return None
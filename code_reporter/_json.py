@@ -0,0 +1,28 @@
+"""JSON helpers that use orjson when it is installed.
+
+API responses and lock files can be large; orjson parses them several
+times faster than the stdlib ``json`` module. Both raise a ``ValueError``
+subclass on malformed input, so callers can treat them interchangeably.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
@@ -6,25 +6,38 @@ via blacklist/whitelist with simple JSON override.
 
 from __future__ import annotations
 
-import json
 import os
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional, Set
+from types import MappingProxyType
+from typing import AbstractSet, Final, Iterable, Mapping, Optional, Tuple
 
+from ._json import loads as json_loads
 
+
+# Separators ignored when matching language names
+_STRIP_SEPARATORS = str.maketrans("", "", " -.")
+_STRIP_SEPARATORS_ASCII = b" -."
+
+
+@lru_cache(maxsize=1024)
 def _normalize_lang(name: str) -> str:
     """Normalize language names for matching (case/spacing variations)."""
     if not name:
         return ""
-    lowered = name.strip().lower()
-    # Remove common separators to match variants like "Docker ignore" vs "dockerignore"
-    for ch in [" ", "-", "."]:
-        lowered = lowered.replace(ch, "")
-    return lowered
+    # Remove common separators to match variants like "Docker ignore" vs "dockerignore".
+    # Interned so the filter sets and alias map share key identity with lookups.
+    if name.isascii():
+        # SCC language names are almost always ASCII; bytes ops skip Unicode case tables.
+        normalized = name.encode("ascii").strip().lower().translate(None, _STRIP_SEPARATORS_ASCII).decode("ascii")
+    else:
+        normalized = name.strip().lower().translate(_STRIP_SEPARATORS)
+    return sys.intern(normalized)
 
 
-DEFAULT_BLACKLIST = {
+DEFAULT_BLACKLIST: Final = frozenset({
     # Markup / data formats
     "css",
     "scss",
@@ -53,10 +66,10 @@ DEFAULT_BLACKLIST = {
     "lock",
     "license",
     "plaintext",
-}
+})
 
 # A sensible default whitelist in case users opt into whitelist mode.
-DEFAULT_WHITELIST = {
+DEFAULT_WHITELIST: Final = frozenset({
     "python",
     "go",
     "php",
@@ -70,53 +83,102 @@ DEFAULT_WHITELIST = {
     "csharp",
     "ruby",
     "swift",
-}
+})
+
+# Canonical label -> aliases merged under that label
+_DEFAULT_ALIASES: Final[Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    "Shell": (
+        "Shell", "Bash", "BASH", "Zsh", "zsh", "Ksh", "Tcsh", "csh", "sh", "fish",
+        "PowerShell", "Powershell", "pwsh", "ps1", "psm1"
+    ),
+})
+
+# Pre-normalized defaults, shared by every config that doesn't override them
+_DEFAULT_BLACKLIST_NORM = frozenset(map(_normalize_lang, DEFAULT_BLACKLIST))
+_DEFAULT_WHITELIST_NORM = frozenset(map(_normalize_lang, DEFAULT_WHITELIST))
+
+
+def _build_alias_map(language_aliases: Mapping[str, Iterable[str]]) -> dict:
+    """Build a normalized alias -> canonical label lookup."""
+    return {
+        _normalize_lang(alias): canonical
+        for canonical, aliases in language_aliases.items()
+        for alias in aliases
+    }
 
 
-@dataclass
+_DEFAULT_ALIAS_MAP: Final = MappingProxyType(_build_alias_map(_DEFAULT_ALIASES))
+
+
+def _normalized_set(names: Iterable[str], default: frozenset, default_norm: frozenset) -> frozenset:
+    """Normalize a language list, reusing the precomputed set for unchanged defaults."""
+    if names is default or names == default:
+        return default_norm
+    return frozenset(map(_normalize_lang, names))
+
+
+@dataclass(slots=True, frozen=True)
 class ReportConfig:
     language_filter_mode: str = "blacklist"  # "blacklist" or "whitelist"
-    languages_blacklist: Set[str] = field(default_factory=lambda: set(DEFAULT_BLACKLIST))
-    languages_whitelist: Set[str] = field(default_factory=lambda: set(DEFAULT_WHITELIST))
+    # Defaults are shared immutable objects; pass a new collection to override
+    languages_blacklist: AbstractSet[str] = DEFAULT_BLACKLIST
+    languages_whitelist: AbstractSet[str] = DEFAULT_WHITELIST
     min_language_lines: int = 500
-    # Map canonical label -> list of aliases to merge under that label
-    language_aliases: dict = field(default_factory=lambda: {
-        "Shell": [
-            "Shell", "Bash", "BASH", "Zsh", "zsh", "Ksh", "Tcsh", "csh", "sh", "fish",
-            "PowerShell", "Powershell", "pwsh", "ps1", "psm1"
-        ],
-    })
+    # Map canonical label -> tuple of aliases to merge under that label
+    language_aliases: Mapping[str, Tuple[str, ...]] = field(default_factory=lambda: _DEFAULT_ALIASES)
     # Group tiny pie slices under "Other" if below this fraction (e.g., 0.05 = 5%)
     pie_small_slice_threshold: float = 0.05
 
+    # Lookup tables derived in __post_init__ (use dataclasses.replace() to change settings)
+    _norm_blacklist: frozenset = field(init=False, repr=False, compare=False)
+    _norm_whitelist: frozenset = field(init=False, repr=False, compare=False)
+    _filter_set: frozenset = field(init=False, repr=False, compare=False)
+    _filter_keep: bool = field(init=False, repr=False, compare=False)
+    _alias_map: Mapping[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        set_attr = object.__setattr__  # frozen dataclass
+        norm_blacklist = _normalized_set(self.languages_blacklist, DEFAULT_BLACKLIST, _DEFAULT_BLACKLIST_NORM)
+        norm_whitelist = _normalized_set(self.languages_whitelist, DEFAULT_WHITELIST, _DEFAULT_WHITELIST_NORM)
+        set_attr(self, "_norm_blacklist", norm_blacklist)
+        set_attr(self, "_norm_whitelist", norm_whitelist)
+        # Resolve the filter mode once: a name is reportable when its membership
+        # in _filter_set equals _filter_keep (whitelist: in set; blacklist: not in set)
+        if self.language_filter_mode == "whitelist":
+            set_attr(self, "_filter_set", norm_whitelist)
+            set_attr(self, "_filter_keep", True)
+        else:
+            set_attr(self, "_filter_set", norm_blacklist)
+            set_attr(self, "_filter_keep", False)
+        if self.language_aliases is _DEFAULT_ALIASES:
+            set_attr(self, "_alias_map", _DEFAULT_ALIAS_MAP)
+        else:
+            set_attr(self, "_alias_map", _build_alias_map(self.language_aliases))
+
     def is_language_reportable(self, name: Optional[str]) -> bool:
         if not name:
             return False
+        return (_normalize_lang(name) in self._filter_set) is self._filter_keep
+
+    def classify(self, name: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """Return (is_language_reportable(name), canonical_language(name)) in one pass."""
+        if not name:
+            return False, None
         key = _normalize_lang(name)
-        if self.language_filter_mode == "whitelist":
-            return key in { _normalize_lang(x) for x in self.languages_whitelist }
-        # blacklist (default)
-        return key not in { _normalize_lang(x) for x in self.languages_blacklist }
+        return (key in self._filter_set) is self._filter_keep, self._alias_map.get(key, name)
 
     def canonical_language(self, name: Optional[str]) -> Optional[str]:
         if not name:
             return None
-        norm = _normalize_lang(name)
-        # Build alias map once
-        alias_map = {}
-        for canonical, aliases in self.language_aliases.items():
-            for a in aliases:
-                alias_map[_normalize_lang(a)] = canonical
-        return alias_map.get(norm, name)
+        return self._alias_map.get(_normalize_lang(name), name)
 
 
 def _load_json(path: Path) -> Optional[dict]:
     try:
-        if path.exists():
-            return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        pass
-    return None
+        with open(path, "rb") as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
 
 
 def load_config() -> ReportConfig:
@@ -125,29 +187,71 @@ def load_config() -> ReportConfig:
     Load order:
     1) Defaults
     2) Environment overrides (from .env): PIE_SMALL_SLICE_THRESHOLD
+
+    The result is cached for the process and shared between callers; it is
+    rebuilt only when the relevant environment variables change. Call
+    ``clear_cache()`` to force a reload.
     """
-    return _apply_env_overrides(ReportConfig())
+    return _load_config(_pie_threshold_env())
+
+
+@lru_cache(maxsize=1)
+def _load_config(pie_threshold_raw: Optional[str]) -> ReportConfig:
+    return _apply_env_overrides(ReportConfig(), pie_threshold_raw)
+
+
+def clear_cache() -> None:
+    """Drop the cached config so the next load_config() call rebuilds it."""
+    _load_config.cache_clear()
 
 
 def _from_dict(data: dict) -> ReportConfig:  # deprecated path; kept for compatibility if needed
-    # Not used now; JSON discovery removed. Kept to avoid breaking imports.
-    return ReportConfig()
+    # Not used by load_config now (JSON discovery removed). Language lists are
+    # normalized once here, at construction, rather than on every lookup.
+    kwargs = {}
+    if data.get("language_filter_mode") in ("blacklist", "whitelist"):
+        kwargs["language_filter_mode"] = data["language_filter_mode"]
+    # Lists must be real sequences: frozenset("css") would split a bare string
+    # into characters. Values of any other type are ignored.
+    for key in ("languages_blacklist", "languages_whitelist"):
+        if data.get(key) and isinstance(data[key], (list, tuple)):
+            kwargs[key] = frozenset(data[key])
+    if isinstance(data.get("language_aliases"), dict):
+        kwargs["language_aliases"] = MappingProxyType({
+            canonical: tuple(aliases)
+            for canonical, aliases in data["language_aliases"].items()
+            if isinstance(aliases, (list, tuple))
+        })
+    return ReportConfig(**kwargs)
+
 
+def _pie_threshold_env() -> Optional[str]:
+    """Raw pie threshold from the environment (primary name, then alias)."""
+    return os.getenv("PIE_SMALL_SLICE_THRESHOLD") or os.getenv("CODE_REPORTER_PIE_SMALL_SLICE_THRESHOLD")
 
-def _apply_env_overrides(cfg: ReportConfig) -> ReportConfig:
+
+@lru_cache(maxsize=8)
+def _parse_pie_threshold(raw: Optional[str]) -> Optional[float]:
+    """Parse and clamp a pie threshold to [0,1]; None if unset or invalid."""
+    if raw is None:
+        return None
+    try:
+        val = float(raw)
+    except ValueError:
+        return None
+    return max(0.0, min(1.0, val))
+
+
+def _apply_env_overrides(cfg: ReportConfig, pie_threshold_raw: Optional[str] = None) -> ReportConfig:
     """Override config values from environment variables (.env supported).
 
     Supported env vars:
     - PIE_SMALL_SLICE_THRESHOLD (float 0..1), e.g., 0.10 for 10%
     - CODE_REPORTER_PIE_SMALL_SLICE_THRESHOLD (alias)
     """
-    try:
-        raw = os.getenv("PIE_SMALL_SLICE_THRESHOLD") or os.getenv("CODE_REPORTER_PIE_SMALL_SLICE_THRESHOLD")
-        if raw is not None:
-            val = float(raw)
-            # clamp to [0,1]
-            val = max(0.0, min(1.0, val))
-            cfg.pie_small_slice_threshold = val
-    except Exception:
-        pass
+    if pie_threshold_raw is None:
+        pie_threshold_raw = _pie_threshold_env()
+    threshold = _parse_pie_threshold(pie_threshold_raw)
+    if threshold is not None:
+        cfg = replace(cfg, pie_small_slice_threshold=threshold)
     return cfg
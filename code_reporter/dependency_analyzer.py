@@ -1,30 +1,196 @@
 """Dependency analysis and CVE detection functionality."""
 
-import json
+import os
 import re
+import shutil
 import subprocess
+import tomllib
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
 import requests
-import time
-import tomli
-import yaml
-import os
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from ._http_cache import ResultCache, create_session
+from ._json import loads as json_loads
 from .logger import get_logger
 
 
+# Concurrent OSV /vulns/{id} fetches when hydrating batch results
+MAX_HYDRATION_WORKERS = 16
+
+# Concurrent OSV querybatch requests; kept low so large scans don't spike OSV
+MAX_OSV_BATCH_WORKERS = 4
+
+# OSV querybatch accepts up to 1000 queries per request
+OSV_BATCH_SIZE = 1000
+
+# Full license texts -> short names, tried in order (first match wins)
+_LICENSE_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), name) for pattern, name in (
+    (r'BSD.*3.*Clause', 'BSD-3-Clause'),
+    (r'BSD.*2.*Clause', 'BSD-2-Clause'),
+    (r'Copyright.*Redistribution and use in source and binary forms', 'BSD'),
+    (r'Apache.*License.*Version.*2', 'Apache-2.0'),
+    (r'GPL.*v?3', 'GPL-3.0'),
+    (r'GPL.*v?2', 'GPL-2.0'),
+    (r'MIT License', 'MIT'),
+    (r'MIT', 'MIT'),
+    (r'LGPL', 'LGPL'),
+    (r'ISC', 'ISC'),
+    (r'Mozilla', 'MPL'),
+))
+
+# Plain numeric CVSS scores, as opposed to vector strings
+_NUMERIC_SCORE_RE = re.compile(r'^\d+(?:\.\d+)?$')
+
+# Upper-cased advisory severity labels -> report labels, and their ranking
+_SEVERITY_MAP = {'CRITICAL': 'Critical', 'HIGH': 'High', 'MODERATE': 'Medium', 'MEDIUM': 'Medium', 'LOW': 'Low'}
+_SEVERITY_RANK = {'CRITICAL': 4, 'HIGH': 3, 'MODERATE': 2, 'MEDIUM': 2, 'LOW': 1}
+# Lower bounds of the Medium/High/Critical CVSS buckets; positive scores below them are Low
+_CVSS_THRESHOLDS = (4.0, 7.0, 9.0)
+_SEVERITY_BUCKETS = ('Low', 'Medium', 'High', 'Critical')
+
+# Virtual/meta packages per language; these have no registry license
+_VIRTUAL_PACKAGES = {
+    'php': frozenset({'composer-runtime-api', 'composer-plugin-api', 'php'}),
+    'python': frozenset({'python'}),
+    'golang': frozenset(),
+}
+
+# Common PyPI license classifier names -> short identifiers
+_PYPI_CLASSIFIER_NAMES = {
+    'MIT License': 'MIT',
+    'BSD License': 'BSD',
+    'Apache Software License': 'Apache-2.0',
+}
+
+# composer.lock size above which it is streamed (when ijson is available)
+LOCK_STREAM_THRESHOLD = 256 * 1024
+
+# Resolved once at import; None when composer isn't installed
+_COMPOSER_BIN = shutil.which('composer')
+
+# Concurrent registry (PyPI/Packagist/Go) license lookups
+MAX_LICENSE_WORKERS = 16
+
+# License passes run alongside their repository's OSV checks
+MAX_LICENSE_PASSES = 4
+
+# Worker pools shared by every analyzer and every repository analyzed at once,
+# so the thread count stays bounded however many repositories run in parallel.
+# Tasks submitted to these never wait on work queued in the same pool.
+_HYDRATION_POOL = ThreadPoolExecutor(max_workers=MAX_HYDRATION_WORKERS, thread_name_prefix='osv-hydrate')
+_OSV_BATCH_POOL = ThreadPoolExecutor(max_workers=MAX_OSV_BATCH_WORKERS, thread_name_prefix='osv-batch')
+_LICENSE_POOL = ThreadPoolExecutor(max_workers=MAX_LICENSE_WORKERS, thread_name_prefix='license')
+_LICENSE_PASS_POOL = ThreadPoolExecutor(max_workers=MAX_LICENSE_PASSES, thread_name_prefix='license-pass')
+
+# Leading package name in a requirement string ("requests>=2.0" -> "requests")
+_PACKAGE_NAME_RE = re.compile(r'^([a-zA-Z0-9_.-]+)(.*)')
+# One requirements.txt entry per line, skipping comments and pip options ("-r", "-e", ...)
+_REQUIREMENT_LINE_RE = re.compile(r'^[ \t]*(?![#\-])([a-zA-Z0-9_.-]+)([^\n]*)', re.MULTILINE)
+# Constraint operators/wildcards before the version, and the version itself
+_CONSTRAINT_PREFIX_RE = re.compile(r'^[\^\~\>\<\=\!\s\*]+')
+_CONSTRAINT_PREFIX_CHARS = '^~><=!* \t\n\r\f\v'
+_VERSION_RE = re.compile(r'(\d+(?:\.\d+)*(?:\.\d+)*)')
+
+# Dependency groups in the per-language view: (key, dev, indirect)
+_PACKAGE_GROUPS = (
+    ('packages', False, False),
+    ('dev_packages', True, False),
+    ('indirect_packages', False, True),
+)
+
+# GitHub advisory IDs; anything else is left to the per-ID lookup
+_GHSA_ID_RE = re.compile(r'^GHSA(?:-[0-9a-z]{4}){3}$')
+
+# Advisories resolved per batched GitHub GraphQL request (one aliased field each)
+GHSA_BATCH_SIZE = 50
+
+# Detected language -> OSV ecosystem name
+OSV_ECOSYSTEMS = {
+    'python': 'PyPI',
+    'php': 'Packagist',
+    'golang': 'Go'
+}
+
+
+def _numeric_score(raw) -> Optional[float]:
+    """Return a CVSS score given as a number or numeric string, else None."""
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    if isinstance(raw, str) and _NUMERIC_SCORE_RE.match(raw):
+        return float(raw)
+    return None
+
+
+def _is_dehydrated(vuln: Dict) -> bool:
+    """Whether an OSV record is a querybatch stub (ID and dates, no details)."""
+    return 'summary' not in vuln and 'details' not in vuln
+
+
+def _fit_results(results: List[Optional[Dict]], size: int) -> List[Optional[Dict]]:
+    """Pad with None or truncate so a batch's results line up with its queries."""
+    return results[:size] + [None] * (size - len(results))
+
+
+def _iter_lock_packages(lock_path: Path, sections: Sequence[str] = ('packages', 'packages-dev')) -> Iterator[Tuple[str, Dict]]:
+    """Yield (section, package entry) pairs from composer.lock, section by section.
+
+    Large lockfiles are streamed with ijson when it is installed, so only one
+    package entry is materialized at a time; otherwise the file is parsed whole, once.
+    """
+    if ijson is not None and lock_path.stat().st_size >= LOCK_STREAM_THRESHOLD:
+        with open(lock_path, 'rb') as f:
+            for section in sections:
+                f.seek(0)
+                for pkg in ijson.items(f, f'{section}.item'):
+                    yield section, pkg
+        return
+    lock_data = json_loads(lock_path.read_bytes())
+    for section in sections:
+        for pkg in lock_data.get(section, []) or []:
+            yield section, pkg
+
+
+@dataclass(slots=True)
+class PackageRecord:
+    """A single dependency, flattened across languages and dependency groups."""
+    name: str
+    version: str
+    language: str
+    source: str
+    constraint: str = ''
+    dev: bool = False
+    indirect: bool = False
+
+
 class DependencyAnalyzer:
     """Analyzes project dependencies and checks for security vulnerabilities."""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None, result_cache: Optional[ResultCache] = None):
         self.osv_api_base = "https://api.osv.dev/v1"
-        self.session = requests.Session()
+        self.session = session or create_session()
         # Cache for CVE lookups to avoid repeated API calls
         self._cve_cache = {}
+        # Optional on-disk store so normalized OSV findings, advisory lookups
+        # (OSV by-id, GHSA) and registry licenses survive between runs
+        self._result_cache = result_cache
         # GitHub token for GHSA fallback (optional)
         self.github_token = os.getenv('GITHUB_TOKEN')
-        self._ghsa_cache: Dict[str, Dict] = {}
+        self._ghsa_cache: Dict[str, Optional[Dict]] = {}
+        # Full OSV advisories by ID (None for failed lookups, so they aren't retried)
+        self._osv_byid_cache: Dict[str, Optional[Dict]] = {}
+        # Normalized findings by vuln ID; one CVE often affects many packages
+        self._vuln_cache: Dict[str, Dict] = {}
     
     def analyze_repository(self, repo_path: Path, language_info: Dict) -> Dict:
         """
@@ -66,9 +232,15 @@ class DependencyAnalyzer:
                 go_deps = self._analyze_golang_dependencies(repo_path)
                 result['dependencies']['golang'] = go_deps
         
-        # Check for vulnerabilities
         all_packages = self._flatten_dependencies(result['dependencies'])
+
+        # Collect license information for dependencies (all: direct, dev, indirect).
+        # Registry lookups hit different hosts from OSV, so run both passes at once.
+        licenses = _LICENSE_PASS_POOL.submit(self._collect_dependency_licenses, all_packages, repo_path, language_info)
+
+        # Check for vulnerabilities
         result['vulnerabilities'] = self._check_vulnerabilities(all_packages)
+        result['licenses'] = licenses.result()
 
         # Compute unique non-dev vulnerable packages for clearer managerial reporting
         unique_non_dev_packages = set()
@@ -79,9 +251,6 @@ class DependencyAnalyzer:
         # Update headline summary to exclude dev deps and use unique package count
         result['summary']['vulnerable_packages'] = len(unique_non_dev_packages)
 
-        # Collect license information for dependencies (all: direct, dev, indirect)
-        result['licenses'] = self._collect_dependency_licenses(all_packages, repo_path, language_info)
-        
         # Compute headline counts: direct-only vs overall
         direct_only_count = 0
         for lang_deps in result['dependencies'].values():
@@ -112,8 +281,7 @@ class DependencyAnalyzer:
             result['package_files'].append('composer.json')
             
             try:
-                with open(composer_json, 'r') as f:
-                    composer_data = json.load(f)
+                composer_data = json_loads(composer_json.read_bytes())
                 
                 # Extract dependencies
                 require = composer_data.get('require', {})
@@ -130,42 +298,31 @@ class DependencyAnalyzer:
         if composer_lock.exists():
             result['package_files'].append('composer.lock')
             try:
-                with open(composer_lock, 'r') as f:
-                    lock_data = json.load(f)
-
-                # Override direct deps with exact versions; capture transitive separately
-                packages = lock_data.get('packages', [])
-                for package in packages:
+                # Override direct deps with exact versions; capture transitive separately.
+                # Dev packages from lock override direct dev and include additional ones.
+                # Entries parsed from composer.json are updated in place.
+                direct = result['packages']
+                dev = result['dev_packages']
+                indirect = result['indirect_packages']
+                for section, package in _iter_lock_packages(composer_lock):
                     name = package.get('name')
                     version = package.get('version', '').lstrip('v')
-                    if name and version:
-                        if name in result['packages']:
-                            # Direct dependency: override with locked version
-                            result['packages'][name] = {
-                                'version': version,
-                                'constraint': result['packages'].get(name, {}).get('constraint', ''),
-                                'source': 'composer.lock'
-                            }
-                        else:
-                            # Transitive dependency: record under indirect
-                            result['indirect_packages'][name] = {
-                                'version': version,
-                                'constraint': '',
-                                'source': 'composer.lock'
-                            }
-
-                # Handle dev packages from lock (override direct dev and include additional)
-                packages_dev = lock_data.get('packages-dev', [])
-                for package in packages_dev:
-                    name = package.get('name')
-                    version = package.get('version', '').lstrip('v')
-                    if name and version:
-                        prev = result['dev_packages'].get(name, {})
-                        result['dev_packages'][name] = {
-                            'version': version,
-                            'constraint': prev.get('constraint', ''),
-                            'source': 'composer.lock'
-                        }
+                    if not (name and version):
+                        continue
+                    if section == 'packages-dev':
+                        target = dev
+                    elif name in direct:
+                        # Direct dependency: override with locked version
+                        target = direct
+                    else:
+                        # Transitive dependency: record under indirect
+                        target = indirect
+                    existing = target.get(name)
+                    if existing is not None:
+                        existing['version'] = version
+                        existing['source'] = 'composer.lock'
+                    else:
+                        target[name] = {'version': version, 'constraint': '', 'source': 'composer.lock'}
 
             except Exception:
                 pass  # composer.lock parsing is optional
@@ -230,20 +387,16 @@ class DependencyAnalyzer:
         packages = {}
         try:
             content = req_file.read_text()
-            for line in content.splitlines():
-                line = line.strip()
-                if line and not line.startswith('#') and not line.startswith('-'):
-                    # Parse package==version or package>=version etc.
-                    match = re.match(r'^([a-zA-Z0-9_.-]+)(.*)', line)
-                    if match:
-                        name = match.group(1)
-                        constraint = match.group(2) or ''
-                        version = self._extract_version_from_constraint(constraint)
-                        packages[name] = {
-                            'version': version,
-                            'constraint': constraint,
-                            'source': 'requirements.txt'
-                        }
+            # Parse package==version or package>=version etc.
+            for match in _REQUIREMENT_LINE_RE.finditer(content):
+                name = match.group(1)
+                constraint = match.group(2).strip()
+                version = self._extract_version_from_constraint(constraint)
+                packages[name] = {
+                    'version': version,
+                    'constraint': constraint,
+                    'source': 'requirements.txt'
+                }
         except Exception:
             pass
         
@@ -254,7 +407,7 @@ class DependencyAnalyzer:
         packages = {'main': {}, 'dev': {}}
         try:
             with open(pyproject, 'rb') as f:
-                data = tomli.load(f)
+                data = tomllib.load(f)
             
             # Check project dependencies
             project_deps = data.get('project', {}).get('dependencies', [])
@@ -304,7 +457,7 @@ class DependencyAnalyzer:
         packages = {'main': {}, 'dev': {}}
         try:
             content = pipfile.read_text()
-            data = tomli.loads(content)
+            data = tomllib.loads(content)
             
             # Main packages
             main_packages = data.get('packages', {})
@@ -363,46 +516,36 @@ class DependencyAnalyzer:
             try:
                 content = go_mod.read_text()
                 
-                # Parse require block
-                require_match = re.search(r'require\s*\((.*?)\)', content, re.DOTALL)
-                if require_match:
-                    require_block = require_match.group(1)
-                    for line in require_block.split('\n'):
-                        line = line.strip()
-                        if line and not line.startswith('//'):
-                            # Distinguish transitive lines: "... vX.Y.Z // indirect"
-                            is_indirect = ' // indirect' in line
-                            clean = line.split('//')[0].strip()
-                            parts = clean.split()
-                            if len(parts) >= 2:
-                                name = parts[0]
-                                version_token = parts[1]
-                                version = version_token.lstrip('v')
-                                target = result['indirect_packages' if is_indirect else 'packages']
-                                target[name] = {
-                                    'version': version,
-                                    'constraint': version_token,
-                                    'source': 'go.mod'
-                                }
-                
-                # Also parse single line requires
-                for line in content.split('\n'):
+                # Single pass over the file: track whether we're inside a
+                # "require ( ... )" block; otherwise only "require mod ver" lines count.
+                in_block = False
+                for line in content.splitlines():
                     line = line.strip()
-                    if line.startswith('require ') and '(' not in line:
-                        body = line.replace('require ', '').strip()
-                        is_indirect = ' // indirect' in body
-                        clean = body.split('//')[0].strip()
-                        parts = clean.split()
-                        if len(parts) >= 2:
-                            name = parts[0]
-                            version_token = parts[1]
-                            version = version_token.lstrip('v')
-                            target = result['indirect_packages' if is_indirect else 'packages']
-                            target[name] = {
-                                'version': version,
-                                'constraint': version_token,
-                                'source': 'go.mod'
-                            }
+                    if in_block:
+                        if line.startswith(')'):
+                            in_block = False
+                            continue
+                        entry = line
+                    elif line.startswith('require') and line[7:8] in (' ', '\t', '('):
+                        entry = line[7:].strip()
+                        if entry.startswith('('):
+                            in_block = True
+                            continue
+                    else:
+                        continue
+
+                    # Distinguish transitive lines: "... vX.Y.Z // indirect"
+                    clean, _, comment = entry.partition('//')
+                    parts = clean.split()
+                    if len(parts) >= 2:
+                        name, version_token = parts[0], parts[1]
+                        is_indirect = comment.strip().startswith('indirect')
+                        target = result['indirect_packages' if is_indirect else 'packages']
+                        target[name] = {
+                            'version': version_token.lstrip('v'),
+                            'constraint': version_token,
+                            'source': 'go.mod'
+                        }
                             
             except Exception as e:
                 result['error'] = f"Failed to parse go.mod: {str(e)}"
@@ -412,197 +555,88 @@ class DependencyAnalyzer:
     def _parse_python_dependency(self, dep_string: str) -> Tuple[str, str]:
         """Parse a Python dependency string into name and constraint."""
         # Handle various formats: "package", "package==1.0", "package>=1.0", etc.
-        match = re.match(r'^([a-zA-Z0-9_.-]+)(.*)', dep_string.strip())
+        match = _PACKAGE_NAME_RE.match(dep_string.strip())
         if match:
             return match.group(1), match.group(2) or ''
         return '', ''
     
-    def _extract_version_from_constraint(self, constraint: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_version_from_constraint(constraint: str) -> str:
         """Extract a specific version number from a constraint string."""
         if not constraint:
             return 'unknown'
         
+        # Fast path for the common shapes ("1.2.3", "==1.2.3", "^2.0"): after the
+        # operators the version starts immediately, so scan it without regexes
+        c = constraint.lstrip(_CONSTRAINT_PREFIX_CHARS)
+        n = len(c)
+        end = 0
+        while end < n and c[end].isdecimal():
+            end += 1
+        if end:
+            while end + 1 < n and c[end] == '.' and c[end + 1].isdecimal():
+                end += 2
+                while end < n and c[end].isdecimal():
+                    end += 1
+            return c[:end]
+        
         # Remove constraint operators and extract version
-        cleaned = re.sub(r'^[\^\~\>\<\=\!\s\*]+', '', constraint)
-        version_match = re.search(r'(\d+(?:\.\d+)*(?:\.\d+)*)', cleaned)
+        cleaned = _CONSTRAINT_PREFIX_RE.sub('', constraint)
+        version_match = _VERSION_RE.search(cleaned)
         return version_match.group(1) if version_match else 'unknown'
     
-    def _flatten_dependencies(self, dependencies: Dict) -> List[Dict]:
-        """Flatten nested dependency structure into a list of packages.
+    def _flatten_dependencies(self, dependencies: Dict) -> Tuple[PackageRecord, ...]:
+        """Flatten nested dependency structure into a tuple of packages.
 
         Includes direct, dev, and indirect (transitive) dependencies when present.
+        Each (language, name, version) appears once; a package listed in several
+        groups keeps its first entry, unless a later one shows it is also a
+        runtime (non-dev) dependency. The result is shared read-only by the
+        vulnerability and license passes.
         """
-        packages = []
+        packages: Dict[Tuple[str, str, str], PackageRecord] = {}
         
         for lang, lang_deps in dependencies.items():
             if not lang_deps.get('detected'):
                 continue
-                
-            # Add main packages
-            for name, info in lang_deps.get('packages', {}).items():
-                packages.append({
-                    'name': name,
-                    'version': info['version'],
-                    'language': lang,
-                    'source': info['source'],
-                    'dev': False,
-                    'indirect': False
-                })
-            
-            # Add dev packages
-            for name, info in lang_deps.get('dev_packages', {}).items():
-                packages.append({
-                    'name': name,
-                    'version': info['version'],
-                    'language': lang,
-                    'source': info['source'],
-                    'dev': True,
-                    'indirect': False
-                })
-
-            # Add indirect (transitive) packages if present
-            for name, info in lang_deps.get('indirect_packages', {}).items():
-                packages.append({
-                    'name': name,
-                    'version': info['version'],
-                    'language': lang,
-                    'source': info['source'],
-                    'dev': False,
-                    'indirect': True
-                })
 
-        return packages
+            for group, dev, indirect in _PACKAGE_GROUPS:
+                for name, info in lang_deps.get(group, {}).items():
+                    key = (lang, name, info['version'])
+                    prev = packages.get(key)
+                    if prev is None or (prev.dev and not dev):
+                        packages[key] = PackageRecord(name, info['version'], lang, info['source'],
+                                                      info.get('constraint', ''), dev, indirect)
+
+        return tuple(packages.values())
     
-    def _check_vulnerabilities(self, packages: List[Dict]) -> List[Dict]:
+    def _check_vulnerabilities(self, packages: Sequence[PackageRecord]) -> List[Dict]:
         """Check packages for known vulnerabilities using OSV batch API with fallback."""
-        logger = get_logger()
-        ecosystem_map = {
-            'python': 'PyPI',
-            'php': 'Packagist',
-            'golang': 'Go'
-        }
+        # Only packages with a resolved version in an OSV ecosystem can be checked;
+        # filter once and carry the ecosystem and cache key through both phases.
+        eligible = [
+            (pkg, OSV_ECOSYSTEMS[pkg.language], f"{pkg.language}:{pkg.name}:{pkg.version}")
+            for pkg in packages
+            if pkg.version != 'unknown' and pkg.language in OSV_ECOSYSTEMS
+        ]
 
-        # Build unique queries and index map
-        queries = []
-        index_to_pkg = []
-        seen = set()
-        for pkg in packages:
-            if pkg['version'] == 'unknown':
-                continue
-            eco = ecosystem_map.get(pkg['language'])
-            if not eco:
-                continue
-            key = (pkg['language'], pkg['name'], pkg['version'])
-            if key in seen:
-                continue
-            seen.add(key)
-            # Cache hit shortcut
-            cache_key = f"{key[0]}:{key[1]}:{key[2]}"
-            if cache_key in self._cve_cache:
-                continue  # will be added from cache later
-            queries.append({
-                "package": {"name": pkg['name'], "ecosystem": eco},
-                "version": pkg['version']
-            })
-            index_to_pkg.append(key)
+        # Unique package versions not already cached in memory (dev and runtime
+        # copies of the same version collapse to one query); hits are added later
+        cve_cache = self._cve_cache
+        pending: Dict[Tuple[str, str, str], str] = {
+            (pkg.language, pkg.name, pkg.version): eco
+            for pkg, eco, cache_key in eligible
+            if cache_key not in cve_cache
+        }
 
-        # Call batch endpoint in chunks
-        batch_vulns_map = {}
-        url = f"{self.osv_api_base}/querybatch"
-        chunk_size = 100
-        for i in range(0, len(queries), chunk_size):
-            chunk = queries[i:i+chunk_size]
-            attempt = 0
-            while attempt < 3:
-                try:
-                    resp = self.session.post(url, json={"queries": chunk}, timeout=20)
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        results = data.get('results', [])
-                        for j, res in enumerate(results):
-                            idx = i + j
-                            if idx >= len(index_to_pkg):
-                                continue
-                            key = index_to_pkg[idx]
-                            vulns = res.get('vulns', []) or []
-                            # Debug raw OSV result for this package/version
-                            try:
-                                logger.debug(f"OSV batch result for {key}: {len(vulns)} vulns")
-                                for vv in vulns[:5]:  # limit debug noise
-                                    dbs = vv.get('database_specific', {}) or {}
-                                    logger.debug(
-                                        f"  - id={vv.get('id')} severity_list={vv.get('severity')} db.severity={dbs.get('severity')}"
-                                    )
-                            except Exception:
-                                pass
-                            # Normalize vuln records similar to single query
-                            norm = []
-                            for v in vulns:
-                                label = self._extract_severity_label(v)
-                                score, score_type = self._extract_cvss_score(v)
-                                if not label:
-                                    # Try affected[].ecosystem_specific.severity
-                                    label = self._extract_ecosystem_severity(v)
-                                if not label and score is not None:
-                                    label = self._derive_severity_from_score(score)
-                                if not label and not score:
-                                    # Try fetching full OSV advisory by ID
-                                    vid = v.get('id')
-                                    if vid:
-                                        full = self._fetch_osv_by_id(vid)
-                                        if full:
-                                            label = self._extract_severity_label(full) or self._extract_ecosystem_severity(full)
-                                            if not score:
-                                                score, score_type = self._extract_cvss_score(full)
-                                if not label:
-                                    # GHSA fallback via GitHub API (if token available)
-                                    vid = v.get('id') or ''
-                                    if vid.startswith('GHSA-'):
-                                        adv = self._fetch_github_advisory(vid)
-                                        if adv:
-                                            gh_label = (adv.get('severity') or '').title() if adv.get('severity') else None
-                                            if not score and (adv.get('cvss') or {}).get('score'):
-                                                try:
-                                                    score = float((adv.get('cvss') or {}).get('score'))
-                                                    score_type = 'CVSS_V3'
-                                                except (TypeError, ValueError):
-                                                    pass
-                                            label = gh_label or label
-                                try:
-                                    logger.debug(f"Normalized OSV vuln id={v.get('id')} label={label} cvss={score} type={score_type}")
-                                except Exception:
-                                    pass
-                                norm.append({
-                                    'id': v.get('id'),
-                                    'summary': v.get('summary', 'No summary available'),
-                                    'severity': label or 'Unknown',
-                                    'cvss_score': score,
-                                    'cvss_type': score_type,
-                                    'published': v.get('published'),
-                                    'modified': v.get('modified')
-                                })
-                            self._cve_cache[f"{key[0]}:{key[1]}:{key[2]}"] = norm
-                            batch_vulns_map[key] = norm
-                        break
-                    else:
-                        attempt += 1
-                        time.sleep(0.5 * (attempt))
-                except Exception as e:
-                    attempt += 1
-                    if attempt >= 3:
-                        logger.warning(f"OSV batch query failed after retries: {e}")
-                    else:
-                        time.sleep(0.5 * (attempt))
+        # Only go to OSV when something is missing from the in-memory cache
+        if pending:
+            self._fetch_osv_results(pending)
 
         # Aggregate all vulnerabilities from cache/batch per input package (preserve dev flag)
         vulnerabilities: List[Dict] = []
-        for pkg in packages:
-            if pkg['version'] == 'unknown':
-                continue
-            eco = ecosystem_map.get(pkg['language'])
-            if not eco:
-                continue
-            cache_key = f"{pkg['language']}:{pkg['name']}:{pkg['version']}"
+        for pkg, _, cache_key in eligible:
             vulns = self._cve_cache.get(cache_key)
             if vulns is None:
                 # Fallback to single query if not cached from batch
@@ -611,26 +645,140 @@ class DependencyAnalyzer:
             if vulns:
                 for v in vulns:
                     vulnerabilities.append({
-                        'package': pkg['name'],
-                        'version': pkg['version'],
-                        'language': pkg['language'],
-                        'vulnerability': v,
-                        'dev_dependency': pkg['dev']
+                        'package': pkg.name,
+                        'version': pkg.version,
+                        'language': pkg.language,
+                        'vulnerability': dict(v),
+                        'dev_dependency': pkg.dev
                     })
 
         return vulnerabilities
     
-    def _query_osv_api(self, package: Dict) -> List[Dict]:
+    def _fetch_osv_results(self, pending: Dict[Tuple[str, str, str], str]) -> None:
+        """Query OSV for (language, name, version) keys and fill the CVE cache.
+
+        Args:
+            pending: Keys missing from the in-memory cache, mapped to OSV ecosystem
+        """
+        logger = get_logger()
+
+        # Findings stored on disk by earlier runs skip the network entirely
+        if self._result_cache is not None:
+            stored = self._result_cache.get_many(
+                f"osv:{lang}:{name}:{version}" for lang, name, version in pending
+            )
+            for key in list(pending):
+                vulns = stored.get(f"osv:{key[0]}:{key[1]}:{key[2]}")
+                if vulns is not None:
+                    self._cve_cache[f"{key[0]}:{key[1]}:{key[2]}"] = vulns
+                    del pending[key]
+            if stored:
+                logger.debug(f"OSV results loaded from disk cache for {len(stored)} packages")
+
+        # Build batch queries and index map
+        queries = []
+        index_to_pkg = []
+        for key, eco in pending.items():
+            queries.append({
+                "package": {"name": key[1], "ecosystem": eco},
+                "version": key[2]
+            })
+            index_to_pkg.append(key)
+
+        # Call batch endpoint in chunks; results are dehydrated, normalized below.
+        # Full advisories for records lacking severity/CVSS are fetched as each
+        # chunk lands, so hydration overlaps the batches still in flight.
+        raw_results: Dict[Tuple[str, str, str], List[Dict]] = {}
+        hydrating: Dict[str, Future] = {}
+        hydrated: Dict[str, Dict] = {}
+        chunk_size = OSV_BATCH_SIZE
+        offsets = range(0, len(queries), chunk_size)
+        # Formatting per-record debug lines is skipped entirely unless --verbose
+        debug = logger.is_debug_enabled()
+        if offsets:
+            # Chunks are independent, so overlap their round-trips; results are
+            # merged here on the calling thread, keyed by each chunk's offset.
+            futures = {
+                _OSV_BATCH_POOL.submit(self._post_osv_batch, queries[i:i+chunk_size]): i
+                for i in offsets
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                for j, res in enumerate(future.result()):
+                    idx = i + j
+                    if res is None or idx >= len(index_to_pkg):
+                        continue
+                    key = index_to_pkg[idx]
+                    vulns = res.get('vulns', []) or []
+                    # Debug raw OSV result for this package/version
+                    if debug:
+                        logger.debug(f"OSV batch result for {key}: {len(vulns)} vulns")
+                        for vv in vulns[:5]:  # limit debug noise
+                            dbs = vv.get('database_specific', {}) or {}
+                            logger.debug(
+                                f"  - id={vv.get('id')} severity_list={vv.get('severity')} db.severity={dbs.get('severity')}"
+                            )
+                    raw_results[key] = vulns
+                    for v in vulns:
+                        vid = v.get('id')
+                        if vid and vid not in hydrating and self._needs_hydration(v):
+                            hydrating[vid] = _HYDRATION_POOL.submit(self._fetch_osv_by_id, vid)
+            for vid, pending_fetch in hydrating.items():
+                full = pending_fetch.result()
+                if full:
+                    hydrated[vid] = full
+
+        # Resolve GHSA IDs that will still lack a severity with one GraphQL request
+        self._prefetch_unlabeled_ghsa(
+            (v for vulns in raw_results.values() for v in vulns), hydrated
+        )
+
+        fresh: Dict[str, List[Dict]] = {}
+        for key, vulns in raw_results.items():
+            norm = [self._normalize_vuln(v, hydrated) for v in vulns]
+            self._cve_cache[f"{key[0]}:{key[1]}:{key[2]}"] = norm
+            # Only findings that were fully resolved (and so memoized) go to disk;
+            # anything whose hydration failed is fetched again next run
+            if all(not v.get('id') or v['id'] in self._vuln_cache for v in vulns):
+                fresh[f"osv:{key[0]}:{key[1]}:{key[2]}"] = norm
+        if self._result_cache is not None:
+            self._result_cache.set_many(fresh)
+
+    def _post_osv_batch(self, chunk: List[Dict]) -> List[Dict]:
+        """POST one chunk to the OSV querybatch endpoint.
+
+        Transient failures (429/5xx, connection errors) are retried by the
+        session's adapter. Returns the per-query results in request order, or an
+        empty list on failure (those packages then fall back to single queries).
+        Entries may be None where part of a split batch failed.
+        """
+        logger = get_logger()
+        url = f"{self.osv_api_base}/querybatch"
+        try:
+            resp = self.session.post(url, json={"queries": chunk}, timeout=60)
+        except requests.RequestException as e:
+            logger.warning(f"OSV batch query failed after retries: {e}")
+            return []
+        if resp.status_code == 200:
+            try:
+                return json_loads(resp.content).get('results', [])
+            except ValueError:
+                return []
+        if resp.status_code in (400, 413) and len(chunk) > 1:
+            # Batch rejected as too large: halve it and keep result order. Each
+            # half is fitted to exactly its query count (padded with None where
+            # results are missing) so tail results can't shift onto other packages.
+            mid = len(chunk) // 2
+            head = _fit_results(self._post_osv_batch(chunk[:mid]), mid)
+            return head + _fit_results(self._post_osv_batch(chunk[mid:]), len(chunk) - mid)
+        logger.debug(f"OSV batch query returned HTTP {resp.status_code}")
+        return []
+
+    def _query_osv_api(self, package: PackageRecord) -> List[Dict]:
         """Query OSV API for vulnerabilities."""
         try:
             # Map language to ecosystem
-            ecosystem_map = {
-                'python': 'PyPI',
-                'php': 'Packagist',
-                'golang': 'Go'
-            }
-            
-            ecosystem = ecosystem_map.get(package['language'])
+            ecosystem = OSV_ECOSYSTEMS.get(package.language)
             if not ecosystem:
                 return []
             
@@ -638,71 +786,29 @@ class DependencyAnalyzer:
             url = f"{self.osv_api_base}/query"
             payload = {
                 "package": {
-                    "name": package['name'],
+                    "name": package.name,
                     "ecosystem": ecosystem
                 },
-                "version": package['version']
+                "version": package.version
             }
             
             response = self.session.post(url, json=payload, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 vulns = data.get('vulns', [])
-                try:
-                    logger = get_logger()
-                    logger.debug(f"OSV single result for {package['language']}:{package['name']}:{package['version']}: {len(vulns)} vulns")
+                logger = get_logger()
+                if logger.is_debug_enabled():
+                    logger.debug(f"OSV single result for {package.language}:{package.name}:{package.version}: {len(vulns)} vulns")
                     for vv in vulns[:5]:
                         dbs = vv.get('database_specific', {}) or {}
                         logger.debug(
                             f"  - id={vv.get('id')} severity_list={vv.get('severity')} db.severity={dbs.get('severity')}"
                         )
-                except Exception:
-                    pass
                 
-                results = []
-                for vuln in vulns:
-                    label = self._extract_severity_label(vuln)
-                    score, score_type = self._extract_cvss_score(vuln)
-                    if not label:
-                        label = self._extract_ecosystem_severity(vuln)
-                    if not label and score is not None:
-                        label = self._derive_severity_from_score(score)
-                    if not label and not score:
-                        vid = vuln.get('id')
-                        if vid:
-                            full = self._fetch_osv_by_id(vid)
-                            if full:
-                                label = self._extract_severity_label(full) or self._extract_ecosystem_severity(full)
-                                if not score:
-                                    score, score_type = self._extract_cvss_score(full)
-                    if not label:
-                        vid = vuln.get('id') or ''
-                        if vid.startswith('GHSA-'):
-                            adv = self._fetch_github_advisory(vid)
-                            if adv:
-                                gh_label = (adv.get('severity') or '').title() if adv.get('severity') else None
-                                if not score and (adv.get('cvss') or {}).get('score'):
-                                    try:
-                                        score = float((adv.get('cvss') or {}).get('score'))
-                                        score_type = 'CVSS_V3'
-                                    except (TypeError, ValueError):
-                                        pass
-                                label = gh_label or label
-                    try:
-                        logger = get_logger()
-                        logger.debug(f"Normalized OSV vuln id={vuln.get('id')} label={label} cvss={score} type={score_type}")
-                    except Exception:
-                        pass
-                    results.append({
-                        'id': vuln.get('id'),
-                        'summary': vuln.get('summary', 'No summary available'),
-                        'severity': label or 'Unknown',
-                        'cvss_score': score,
-                        'cvss_type': score_type,
-                        'published': vuln.get('published'),
-                        'modified': vuln.get('modified')
-                    })
-                return results
+                # Enrich up front, concurrently, instead of one lookup per record
+                hydrated = self._hydrate_osv_vulns(vulns)
+                self._prefetch_unlabeled_ghsa(vulns, hydrated)
+                return [self._normalize_vuln(vuln, hydrated) for vuln in vulns]
             
         except Exception:
             # Don't fail the entire analysis if CVE lookup fails
@@ -710,66 +816,135 @@ class DependencyAnalyzer:
         
         return []
     
+    def _normalize_vuln(self, vuln: Dict, hydrated: Optional[Dict[str, Dict]] = None) -> Dict:
+        """Normalize an OSV record to the finding shape used in reports.
+
+        Severity falls back from the record's own fields to the CVSS bucket, then
+        the full OSV advisory (from `hydrated` when given, else fetched by ID),
+        then GitHub's GHSA data. Dehydrated batch records take their summary
+        and dates from the full advisory too.
+
+        Results are memoized per vuln ID only when every lookup they needed
+        succeeded. Incomplete results are neither memoized nor written to the
+        on-disk cache, so a failed lookup is retried on the next run. Callers
+        always get their own copy.
+        """
+        vid = vuln.get('id')
+        if vid and vid in self._vuln_cache:
+            return dict(self._vuln_cache[vid])
+
+        complete = True
+        full = None
+        dehydrated = _is_dehydrated(vuln)
+        label = self._extract_severity_label(vuln)
+        score, score_type = self._extract_cvss_score(vuln)
+        if not label:
+            # Try affected[].ecosystem_specific.severity
+            label = self._extract_ecosystem_severity(vuln)
+        if not label and score is not None:
+            label = self._derive_severity_from_score(score)
+        if vid and (dehydrated or (not label and not score)):
+            # Try the full OSV advisory by ID
+            full = hydrated.get(vid) if hydrated is not None else self._fetch_osv_by_id(vid)
+            if not full:
+                complete = False
+            elif not label and not score:
+                label = self._extract_severity_label(full) or self._extract_ecosystem_severity(full)
+                if not score:
+                    score, score_type = self._extract_cvss_score(full)
+        if not label and (vid or '').startswith('GHSA-'):
+            # GHSA fallback via GitHub API (if token available)
+            adv = self._fetch_github_advisory(vid)
+            if adv:
+                gh_sev = adv.get('severity')
+                gh_label = (_SEVERITY_MAP.get(gh_sev) or gh_sev.title()) if gh_sev else None
+                if not score and (adv.get('cvss') or {}).get('score'):
+                    try:
+                        score = float((adv.get('cvss') or {}).get('score'))
+                        score_type = 'CVSS_V3'
+                    except (TypeError, ValueError):
+                        pass
+                label = gh_label or label
+            elif self.github_token:
+                complete = False
+        logger = get_logger()
+        if logger.is_debug_enabled():
+            logger.debug(f"Normalized OSV vuln id={vid} label={label} cvss={score} type={score_type}")
+        details = full if full and dehydrated else vuln
+        normalized = {
+            'id': vid,
+            'summary': details.get('summary', 'No summary available'),
+            'severity': label or 'Unknown',
+            'cvss_score': score,
+            'cvss_type': score_type,
+            'published': details.get('published'),
+            'modified': details.get('modified') or vuln.get('modified')
+        }
+        if vid and complete:
+            self._vuln_cache[vid] = normalized
+            return dict(normalized)
+        return normalized
+
+    def _hydrate_osv_vulns(self, vulns: List[Dict]) -> Dict[str, Dict]:
+        """Fetch full OSV advisories concurrently for records lacking severity/CVSS.
+
+        Returns a map of vuln ID to full advisory; IDs that fail to fetch are omitted.
+        """
+        ids = sorted({v['id'] for v in vulns if v.get('id') and self._needs_hydration(v)})
+        if not ids:
+            return {}
+        fetched = _HYDRATION_POOL.map(self._fetch_osv_by_id, ids)
+        return {vid: full for vid, full in zip(ids, fetched) if full}
+
+    def _prefetch_unlabeled_ghsa(self, vulns, hydrated: Dict[str, Dict]) -> None:
+        """Batch-fetch GHSA advisories for records OSV data alone can't label."""
+        if not self.github_token:
+            return
+        self._prefetch_github_advisories(
+            v['id'] for v in vulns
+            if (v.get('id') or '').startswith('GHSA-')
+            and not self._own_severity(v)
+            and not self._own_severity(hydrated.get(v['id']) or {})
+        )
+
+    def _needs_hydration(self, vuln: Dict) -> bool:
+        """Whether a batch record lacks the severity/CVSS needed to rank it."""
+        if self._extract_severity_label(vuln) or self._extract_ecosystem_severity(vuln):
+            return False
+        return not self._extract_cvss_score(vuln)[0]
+
     def _extract_severity_label(self, vuln: Dict) -> Optional[str]:
         """Extract textual severity label if present (normalize to standard levels)."""
         label = (vuln.get('database_specific', {}) or {}).get('severity')
         if not label:
             return None
         l = str(label).strip().upper()
-        # Normalize common variants
-        if l in ('CRITICAL',):
-            return 'Critical'
-        if l in ('HIGH',):
-            return 'High'
-        if l in ('MODERATE', 'MEDIUM'):
-            return 'Medium'
-        if l in ('LOW',):
-            return 'Low'
-        return l.title()
+        return _SEVERITY_MAP.get(l) or l.title()
 
     def _extract_cvss_score(self, vuln: Dict) -> tuple[Optional[float], Optional[str]]:
         """Extract CVSS score (v3 preferred, fallback to v2). Returns (score, type)."""
-        sev_list = vuln.get('severity', []) or []
-        # Prefer v3
-        for entry in sev_list:
-            if entry.get('type') == 'CVSS_V3':
-                raw = entry.get('score')
-                # Some OSV entries provide a vector string rather than numeric score
-                if isinstance(raw, (int, float)) or (isinstance(raw, str) and raw.replace('.', '', 1).isdigit()):
-                    try:
-                        return float(raw), 'CVSS_V3'
-                    except (TypeError, ValueError):
-                        pass
-                # If it's a vector like "CVSS:3.1/...", skip numeric conversion here
-                return None, 'CVSS_V3'
-        # Fallback to v2
-        for entry in sev_list:
-            if entry.get('type') == 'CVSS_V2':
-                raw = entry.get('score')
-                if isinstance(raw, (int, float)) or (isinstance(raw, str) and raw.replace('.', '', 1).isdigit()):
+        # Single pass: the first v3 entry wins outright, else the first v2 entry
+        v2_entry = None
+        for entry in vuln.get('severity') or ():
+            entry_type = entry.get('type')
+            if entry_type == 'CVSS_V3':
+                # Some OSV entries provide a vector string ("CVSS:3.1/...") rather than a numeric score
+                return _numeric_score(entry.get('score')), 'CVSS_V3'
+            if entry_type == 'CVSS_V2' and v2_entry is None:
+                v2_entry = entry
+        if v2_entry is not None:
+            return _numeric_score(v2_entry.get('score')), 'CVSS_V2'
+
+        # Other common locations (some OSV entries embed CVSS differently):
+        # a top-level cvss object, then database_specific.cvss
+        dbs = vuln.get('database_specific') or {}
+        for cvss in (vuln.get('cvss') or {}, dbs.get('cvss') or {}):
+            for key in ('score', 'baseScore'):
+                if key in cvss:
                     try:
-                        return float(raw), 'CVSS_V2'
+                        return float(cvss[key]), 'CVSS_V3'
                     except (TypeError, ValueError):
                         pass
-                return None, 'CVSS_V2'
-        
-        # Other common locations (some OSV entries embed CVSS differently)
-        # Top-level cvss object
-        cvss = vuln.get('cvss') or {}
-        for key in ('score', 'baseScore'):
-            if key in cvss:
-                try:
-                    return float(cvss[key]), 'CVSS_V3'
-                except (TypeError, ValueError):
-                    pass
-        # database_specific cvss object
-        dbs = (vuln.get('database_specific') or {}).get('cvss') or {}
-        for key in ('score', 'baseScore'):
-            if key in dbs:
-                try:
-                    return float(dbs[key]), 'CVSS_V3'
-                except (TypeError, ValueError):
-                    pass
         return None, None
 
     def _derive_severity_from_score(self, score: float) -> str:
@@ -778,34 +953,79 @@ class DependencyAnalyzer:
             s = float(score)
         except (TypeError, ValueError):
             return 'Unknown'
-        if s >= 9.0:
-            return 'Critical'
-        if s >= 7.0:
-            return 'High'
-        if s >= 4.0:
-            return 'Medium'
-        if s > 0:
-            return 'Low'
-        return 'Unknown'
+        if not s > 0:
+            return 'Unknown'
+        return _SEVERITY_BUCKETS[bisect_right(_CVSS_THRESHOLDS, s)]
 
     def _extract_ecosystem_severity(self, vuln: Dict) -> Optional[str]:
         """Check affected[].ecosystem_specific.severity values and return highest."""
-        order = {'CRITICAL': 4, 'HIGH': 3, 'MODERATE': 2, 'MEDIUM': 2, 'LOW': 1}
         best = None
         best_rank = 0
         for aff in vuln.get('affected', []) or []:
             sev = ((aff.get('ecosystem_specific') or {}).get('severity') or '').strip().upper()
             if not sev:
                 continue
-            rank = order.get(sev, 0)
+            rank = _SEVERITY_RANK.get(sev, 0)
             if rank > best_rank:
                 best = sev
                 best_rank = rank
-        if best:
-            if best == 'MODERATE':
-                return 'Medium'
-            return best.title()
-        return None
+        return _SEVERITY_MAP.get(best) if best else None
+
+    def _own_severity(self, vuln: Dict) -> Optional[str]:
+        """Severity label derivable from an OSV record alone, without extra lookups."""
+        label = self._extract_severity_label(vuln) or self._extract_ecosystem_severity(vuln)
+        if not label:
+            score, _ = self._extract_cvss_score(vuln)
+            if score is not None:
+                label = self._derive_severity_from_score(score)
+        return label
+
+    def _prefetch_github_advisories(self, ghsa_ids) -> None:
+        """Fetch several GHSA advisories per GraphQL request into the GHSA cache.
+
+        Uses one aliased securityAdvisory field per ID, with the IDs passed as
+        query variables. IDs GitHub doesn't know are cached as None so later
+        lookups don't repeat the request.
+        """
+        ids = sorted({gid for gid in ghsa_ids if gid not in self._ghsa_cache and _GHSA_ID_RE.match(gid)})
+        if ids and self._result_cache is not None:
+            stored = self._result_cache.get_many(f"ghsa:{gid}" for gid in ids)
+            for gid in ids:
+                if f"ghsa:{gid}" in stored:
+                    self._ghsa_cache[gid] = stored[f"ghsa:{gid}"]
+            ids = [gid for gid in ids if gid not in self._ghsa_cache]
+        if not ids:
+            return
+        logger = get_logger()
+        url = 'https://api.github.com/graphql'
+        headers = {'Authorization': f'bearer {self.github_token}'}
+        for i in range(0, len(ids), GHSA_BATCH_SIZE):
+            batch = ids[i:i + GHSA_BATCH_SIZE]
+            params = ', '.join(f'$id{j}: String!' for j in range(len(batch)))
+            fields = ' '.join(
+                f'a{j}: securityAdvisory(ghsaId: $id{j}) {{ severity cvss {{ score vectorString }} }}'
+                for j in range(len(batch))
+            )
+            query = {
+                'query': f'query({params}) {{ {fields} }}',
+                'variables': {f'id{j}': gid for j, gid in enumerate(batch)},
+            }
+            try:
+                resp = self.session.post(url, json=query, headers=headers, timeout=20)
+                if resp.status_code != 200:
+                    logger.debug(f"GitHub advisory batch returned HTTP {resp.status_code}")
+                    continue
+                data = (json_loads(resp.content) or {}).get('data') or {}
+            except Exception as e:
+                logger.debug(f"GitHub advisory batch failed: {e}")
+                continue
+            if not data:
+                continue  # whole query rejected; leave these to per-ID lookups
+            for j, gid in enumerate(batch):
+                self._ghsa_cache[gid] = data.get(f'a{j}')
+            if self._result_cache is not None:
+                self._result_cache.set_many({f"ghsa:{gid}": self._ghsa_cache[gid] for gid in batch})
+            logger.debug(f"GitHub advisories fetched in batch: {len(batch)}")
 
     def _fetch_github_advisory(self, ghsa_id: str) -> Optional[Dict]:
         """Fetch advisory from GitHub by GHSA ID via GraphQL to get severity/CVSS."""
@@ -813,6 +1033,10 @@ class DependencyAnalyzer:
             return None
         if ghsa_id in self._ghsa_cache:
             return self._ghsa_cache[ghsa_id]
+        stored = self._load_stored(f"ghsa:{ghsa_id}")
+        if stored is not None:
+            self._ghsa_cache[ghsa_id] = stored
+            return stored
         url = 'https://api.github.com/graphql'
         query = {
             'query': 'query($id: String!) { securityAdvisory(ghsaId: $id) { severity cvss { score vectorString } } }',
@@ -822,12 +1046,14 @@ class DependencyAnalyzer:
         try:
             resp = self.session.post(url, json=query, headers=headers, timeout=10)
             if resp.status_code == 200:
-                data = resp.json()
+                data = json_loads(resp.content)
                 adv = ((data or {}).get('data') or {}).get('securityAdvisory')
                 if adv:
                     self._ghsa_cache[ghsa_id] = adv
+                    self._store(f"ghsa:{ghsa_id}", adv)
                     logger = get_logger()
-                    logger.debug(f"GitHub advisory fetched for {ghsa_id}: severity={adv.get('severity')} cvss={((adv.get('cvss') or {}).get('score'))}")
+                    if logger.is_debug_enabled():
+                        logger.debug(f"GitHub advisory fetched for {ghsa_id}: severity={adv.get('severity')} cvss={((adv.get('cvss') or {}).get('score'))}")
                     return adv
         except Exception:
             pass
@@ -835,80 +1061,125 @@ class DependencyAnalyzer:
 
     def _fetch_osv_by_id(self, vuln_id: str) -> Optional[Dict]:
         """Fetch full OSV advisory by ID for richer fields (severity, CVSS)."""
-        try:
-            url = f"{self.osv_api_base}/vulns/{vuln_id}"
-            resp = self.session.get(url, timeout=10)
-            if resp.status_code == 200:
-                data = resp.json()
-                logger = get_logger()
-                dbs = (data.get('database_specific') or {})
-                logger.debug(f"OSV by-id fetched for {vuln_id}: db.severity={dbs.get('severity')} severity_list={data.get('severity')}")
-                return data
-        except Exception:
-            pass
-        return None
+        if vuln_id in self._osv_byid_cache:
+            return self._osv_byid_cache[vuln_id]
+        data = self._load_stored(f"osv-vuln:{vuln_id}")
+        if data is None:
+            try:
+                url = f"{self.osv_api_base}/vulns/{vuln_id}"
+                resp = self.session.get(url, timeout=10)
+                if resp.status_code == 200:
+                    data = json_loads(resp.content)
+                    self._store(f"osv-vuln:{vuln_id}", data)
+                    logger = get_logger()
+                    if logger.is_debug_enabled():
+                        dbs = (data.get('database_specific') or {})
+                        logger.debug(f"OSV by-id fetched for {vuln_id}: db.severity={dbs.get('severity')} severity_list={data.get('severity')}")
+            except Exception:
+                data = None
+        self._osv_byid_cache[vuln_id] = data
+        return data
     
-    def _collect_dependency_licenses(self, packages: List[Dict], repo_path: Path, language_info: Dict) -> Dict:
+    def _load_stored(self, key: str):
+        """Look up one entry in the on-disk result cache (None if absent or disabled)."""
+        if self._result_cache is None:
+            return None
+        return self._result_cache.get_many((key,)).get(key)
+
+    def _store(self, key: str, value) -> None:
+        """Save one entry to the on-disk result cache, if enabled."""
+        if self._result_cache is not None:
+            self._result_cache.set_many({key: value})
+
+    def _collect_dependency_licenses(self, packages: Sequence[PackageRecord], repo_path: Path, language_info: Dict) -> Dict:
         """Collect license information for all dependencies."""
-        license_distribution = {}
         license_cache = {}
         
         logger = get_logger()
         logger.debug(f"Starting license detection for {len(packages)} packages")
         
-        # Check if we have PHP packages and try composer licenses first
-        php_packages = [p for p in packages if p['language'] == 'php']
-        composer_licenses = {}
-        
-        if php_packages:
-            composer_licenses = self._get_composer_licenses(repo_path)
-            if composer_licenses:
-                logger.debug(f"Found composer license data for {len(composer_licenses)} packages")
-        
-        for package in packages:
-            # Create cache key
-            cache_key = f"{package['language']}:{package['name']}"
-            
-            if cache_key in license_cache:
-                license_info = license_cache[cache_key]
-                logger.debug(f"License cached: {package['name']} ({package['language']}): {license_info.get('license', 'Unknown')}")
-            else:
-                # For PHP packages, check composer data first
-                if package['language'] == 'php' and package['name'] in composer_licenses:
-                    license_info = composer_licenses[package['name']]
-                    logger.debug(f"License from composer: {package['name']} ({package['language']}): {license_info.get('license', 'Unknown')}")
-                else:
-                    logger.debug(f"Fetching license for {package['name']} ({package['language']})")
-                    license_info = self._get_package_license(package)
-                
+        # Resolve each (language, name) once: composer data first for PHP,
+        # then registry lookups for the rest, fetched concurrently
+        unique = {f"{p.language}:{p.name}": p for p in packages}
+        if len(unique) < len(packages):
+            logger.debug(f"Resolving licenses for {len(unique)} unique packages")
+
+        debug = logger.is_debug_enabled()
+        # Registry answers from earlier runs (composer data is local, so never stored)
+        stored = self._result_cache.get_many(f"license:{k}" for k in unique) if self._result_cache else {}
+        # Lookups run on the shared license pool; results are merged here on the
+        # calling thread, so no locking is needed. `composer licenses` can take a
+        # while; run it alongside the registry lookups for other languages and
+        # only wait on it for the PHP packages
+        php_packages = {k: p for k, p in unique.items() if p.language == 'php'}
+        composer_future = _LICENSE_POOL.submit(self._get_composer_licenses, repo_path) if php_packages else None
+
+        futures: Dict[str, Future] = {}
+        for cache_key, package in unique.items():
+            if package.language != 'php':
+                if f"license:{cache_key}" in stored:
+                    license_cache[cache_key] = stored[f"license:{cache_key}"]
+                    continue
+                if debug:
+                    logger.debug(f"Fetching license for {package.name} ({package.language})")
+                futures[cache_key] = _LICENSE_POOL.submit(self._get_package_license, package)
+
+        composer_licenses = composer_future.result() if composer_future else {}
+        if composer_licenses:
+            logger.debug(f"Found composer license data for {len(composer_licenses)} packages")
+        for cache_key, package in php_packages.items():
+            if package.name in composer_licenses:
+                license_info = composer_licenses[package.name]
                 license_cache[cache_key] = license_info
-                
-                if license_info:
-                    license_name = license_info.get('license', 'Unknown')
-                    logger.debug(f"License found: {license_name}")
-                    if 'raw_license' in license_info:
-                        logger.debug(f"Raw license text (first 100 chars): {license_info['raw_license'][:100]}...")
-                else:
-                    logger.debug("No license information found")
-            
+                if debug:
+                    logger.debug(f"License from composer: {package.name} ({package.language}): {license_info.get('license', 'Unknown')}")
+            elif f"license:{cache_key}" in stored:
+                license_cache[cache_key] = stored[f"license:{cache_key}"]
+            else:
+                if debug:
+                    logger.debug(f"Fetching license for {package.name} ({package.language})")
+                futures[cache_key] = _LICENSE_POOL.submit(self._get_package_license, package)
+
+        fresh = {}
+        for cache_key, future in futures.items():
+            license_info = future.result()
+            license_cache[cache_key] = license_info
+            # Don't persist lookups that failed on a network/API error
+            if license_info and not license_info.get('source', '').endswith('_error'):
+                fresh[f"license:{cache_key}"] = license_info
+            if not debug:
+                continue
+            package = unique[cache_key]
             if license_info:
                 license_name = license_info.get('license', 'Unknown')
-                if license_name and license_name != 'Unknown':
-                    license_distribution[license_name] = license_distribution.get(license_name, 0) + 1
-                else:
-                    license_distribution['Unknown'] = license_distribution.get('Unknown', 0) + 1
+                logger.debug(f"License found for {package.name}: {license_name}")
+                if 'raw_license' in license_info:
+                    logger.debug(f"Raw license text (first 100 chars): {license_info['raw_license'][:100]}...")
             else:
-                license_distribution['Unknown'] = license_distribution.get('Unknown', 0) + 1
+                logger.debug(f"No license information found for {package.name}")
+
+        if self._result_cache is not None:
+            self._result_cache.set_many(fresh)
+        if stored:
+            logger.debug(f"Reused {len(stored)} stored license lookups")
+
+        # Reduce each resolved license to its display name once, then tally per package
+        names = {
+            cache_key: (license_info.get('license') if license_info else None) or 'Unknown'
+            for cache_key, license_info in license_cache.items()
+        }
+        license_distribution = dict(Counter(
+            names[f"{package.language}:{package.name}"] for package in packages
+        ))
         
-        logger = get_logger()
         logger.debug(f"License distribution summary: {license_distribution}")
         return license_distribution
     
-    def _get_package_license(self, package: Dict) -> Optional[Dict]:
+    def _get_package_license(self, package: PackageRecord) -> Optional[Dict]:
         """Get license information for a package from its registry."""
         try:
-            language = package['language']
-            name = package['name']
+            language = package.language
+            name = package.name
             
             # Handle known virtual/meta packages
             if self._is_virtual_package(name, language):
@@ -933,19 +1204,7 @@ class DependencyAnalyzer:
     
     def _is_virtual_package(self, name: str, language: str) -> bool:
         """Check if this is a known virtual/meta package."""
-        virtual_packages = {
-            'php': [
-                'composer-runtime-api',
-                'composer-plugin-api',
-                'php'
-            ],
-            'python': [
-                'python'
-            ],
-            'golang': []
-        }
-        
-        return name in virtual_packages.get(language, [])
+        return name in _VIRTUAL_PACKAGES.get(language, ())
     
     def _get_composer_licenses(self, repo_path: Path) -> Dict:
         """Get license information for PHP packages preferring composer.lock.
@@ -953,54 +1212,65 @@ class DependencyAnalyzer:
         Strategy (fast/safe):
         1) Parse composer.lock for license fields (packages and packages-dev)
            without installing dependencies.
-        2) For any packages still missing license info, attempt a lightweight
-           `composer licenses --format=json` with safe flags (no scripts/plugins).
+        2) Only if some lock entries lack license info (or the lock can't be
+           read), attempt a lightweight `composer licenses --format=json` with
+           safe flags (no scripts/plugins). Dependencies are never installed.
         3) Leave any unresolved packages to be handled by registry fallback
            (Packagist) in _get_package_license.
         """
         licenses: Dict[str, Dict] = {}
+        logger = get_logger()
 
         # Require composer.json and lockfile to proceed
         if not (repo_path / 'composer.json').exists():
             return licenses
         lock_path = repo_path / 'composer.lock'
         if not lock_path.exists():
-            logger = get_logger()
             logger.debug("No composer.lock found - skipping composer licenses")
             return licenses
 
-        logger = get_logger()
         # Step 1: Parse composer.lock
+        lock_complete = False
         try:
-            lock_data = json.loads(lock_path.read_text(encoding='utf-8'))
-            for section in ('packages', 'packages-dev'):
-                for pkg in lock_data.get(section, []) or []:
-                    name = pkg.get('name')
-                    lic = pkg.get('license')
-                    if not name:
-                        continue
-                    if lic:
-                        if isinstance(lic, list):
-                            license_text = ' / '.join([str(x) for x in lic])
-                            raw = str(lic)
-                        else:
-                            license_text = str(lic)
-                            raw = str(lic)
-                        licenses[name] = {
-                            'license': license_text,
-                            'raw_license': raw,
-                            'source': 'composer_lock'
-                        }
+            unlicensed = 0
+            for section, pkg in _iter_lock_packages(lock_path):
+                name = pkg.get('name')
+                lic = pkg.get('license')
+                if not name:
+                    continue
+                if not lic:
+                    # The CLI pass runs with --no-dev, so only runtime gaps count
+                    unlicensed += section == 'packages'
+                else:
+                    if isinstance(lic, list):
+                        license_text = ' / '.join([str(x) for x in lic])
+                        raw = str(lic)
+                    else:
+                        license_text = str(lic)
+                        raw = str(lic)
+                    licenses[name] = {
+                        'license': license_text,
+                        'raw_license': raw,
+                        'source': 'composer_lock'
+                    }
             if licenses:
                 logger.debug(f"composer.lock licenses parsed for {len(licenses)} packages")
+            lock_complete = unlicensed == 0
         except Exception as e:
             logger.debug(f"Failed to parse composer.lock for licenses: {e}")
 
+        if lock_complete:
+            # Every locked package has a license; the CLI pass has nothing to add
+            return licenses
+        if _COMPOSER_BIN is None:
+            logger.debug("composer not found; skipping CLI license pass")
+            return licenses
+
         # Identify missing packages after lock parse (we only know the names later,
         # but composer licenses output can provide broader coverage if available).
         # We try running composer licenses just once; if it fails, we rely on Packagist.
         try:
-            cmd = ['composer', 'licenses', '--format=json', '--no-dev', '--no-scripts', '--no-plugins']
+            cmd = [_COMPOSER_BIN, 'licenses', '--format=json', '--no-dev', '--no-scripts', '--no-plugins']
             result = subprocess.run(
                 cmd,
                 cwd=repo_path,
@@ -1010,8 +1280,9 @@ class DependencyAnalyzer:
             )
             if result.returncode == 0 and result.stdout.strip():
                 try:
-                    composer_data = json.loads(result.stdout)
+                    composer_data = json_loads(result.stdout)
                     deps = composer_data.get('dependencies', {}) or {}
+                    filled = 0
                     if isinstance(deps, dict):
                         for name, dep_info in deps.items():
                             # Only fill gaps not present from lockfile
@@ -1028,7 +1299,8 @@ class DependencyAnalyzer:
                                     'raw_license': str(license_list),
                                     'source': 'composer_command'
                                 }
-                    logger.debug(f"composer licenses filled {len([k for k,v in licenses.items() if v.get('source')=='composer_command'])} missing entries")
+                                filled += 1
+                    logger.debug(f"composer licenses filled {filled} missing entries")
                 except Exception as e:
                     logger.debug(f"Failed to parse composer licenses JSON: {e}")
             else:
@@ -1045,53 +1317,39 @@ class DependencyAnalyzer:
     
     def _clean_license_text(self, license_text: str) -> str:
         """Clean and normalize license text for display."""
-        # If it's a very long license text (full license content), try to extract just the name
-        if len(license_text) > 100:
-            # Look for common license patterns - order matters!
-            license_patterns = [
-                (r'BSD.*3.*Clause', 'BSD-3-Clause'), 
-                (r'BSD.*2.*Clause', 'BSD-2-Clause'),
-                (r'Copyright.*Redistribution and use in source and binary forms', 'BSD'),
-                (r'Apache.*License.*Version.*2', 'Apache-2.0'),
-                (r'GPL.*v?3', 'GPL-3.0'),
-                (r'GPL.*v?2', 'GPL-2.0'),
-                (r'MIT License', 'MIT'),
-                (r'MIT', 'MIT'),
-                (r'LGPL', 'LGPL'),
-                (r'ISC', 'ISC'),
-                (r'Mozilla', 'MPL')
-            ]
-            
-            for pattern, name in license_patterns:
-                if re.search(pattern, license_text, re.IGNORECASE):
-                    return name
-            
-            # If no pattern matches, truncate to first line or first 50 chars
-            first_line = license_text.split('\n')[0].strip()
-            if len(first_line) <= 50:
-                return first_line
-            else:
-                return license_text[:47] + "..."
+        # Short texts are already a license name
+        if len(license_text) <= 100:
+            return license_text
+
+        # A very long text is the full license content; try to extract just the name.
+        # Look for common license patterns - order matters!
+        for pattern, name in _LICENSE_PATTERNS:
+            if pattern.search(license_text):
+                return name
         
-        return license_text
+        # If no pattern matches, truncate to first line or first 50 chars
+        first_line = license_text.partition('\n')[0].strip()
+        if len(first_line) <= 50:
+            return first_line
+        return license_text[:47] + "..."
     
     def _get_pypi_license(self, package_name: str) -> Optional[Dict]:
         """Get license information from PyPI API."""
+        logger = get_logger()
         try:
             url = f"https://pypi.org/pypi/{package_name}/json"
             response = self.session.get(url, timeout=5)
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 info = data.get('info', {})
+                classifiers = info.get('classifiers') or []
                 
-                # Debug: Show what license info is available
-                license_from_api = info.get('license')
-                classifiers = info.get('classifiers', [])
-                license_classifiers = [c for c in classifiers if c.startswith('License ::')]
-                logger = get_logger()
-                logger.debug(f"PyPI response - license field: {repr(license_from_api)}")
-                logger.debug(f"PyPI response - license classifiers: {license_classifiers}")
+                debug = logger.is_debug_enabled()
+                if debug:
+                    # Debug: Show what license info is available
+                    logger.debug(f"PyPI response - license field: {repr(info.get('license'))}")
+                    logger.debug(f"PyPI response - license classifiers: {[c for c in classifiers if c.startswith('License ::')]}")
                 
                 # Try license field first
                 license_text = info.get('license') or ''
@@ -1109,23 +1367,14 @@ class DependencyAnalyzer:
                         'source': 'pypi_license_field'
                     }
                 
-                # Fall back to classifiers
-                classifiers = info.get('classifiers', [])
+                # Fall back to the first usable license classifier
                 for classifier in classifiers:
                     if classifier.startswith('License ::'):
                         # Extract license name from classifier
-                        license_name = classifier.split('::')[-1].strip()
-                        if license_name not in ['Other/Proprietary License']:
-                            # Normalize common classifier names
-                            if license_name == 'MIT License':
-                                license_name = 'MIT'
-                            elif license_name == 'BSD License':
-                                license_name = 'BSD'
-                            elif license_name == 'Apache Software License':
-                                license_name = 'Apache-2.0'
-                            
+                        license_name = classifier.rpartition('::')[2].strip()
+                        if license_name != 'Other/Proprietary License':
                             return {
-                                'license': license_name,
+                                'license': _PYPI_CLASSIFIER_NAMES.get(license_name, license_name),
                                 'raw_license': classifier,
                                 'source': 'pypi_classifier'
                             }
@@ -1139,14 +1388,13 @@ class DependencyAnalyzer:
                         'source': 'pypi_license_expression'
                     }
                 
-                # Debug: Show full info for packages with no license
-                logger = get_logger()
-                logger.debug(f"No license found for {package_name}. Available info keys: {list(info.keys())}")
-                license_related_fields = {k: v for k, v in info.items() if 'license' in k.lower()}
-                logger.debug(f"License-related fields: {license_related_fields}")
-                if 'classifiers' in info:
-                    all_classifiers = info.get('classifiers', [])
-                    logger.debug(f"All classifiers: {[c for c in all_classifiers if 'license' in c.lower() or 'License' in c]}")
+                if debug:
+                    # Debug: Show full info for packages with no license
+                    logger.debug(f"No license found for {package_name}. Available info keys: {list(info.keys())}")
+                    license_related_fields = {k: v for k, v in info.items() if 'license' in k.lower()}
+                    logger.debug(f"License-related fields: {license_related_fields}")
+                    if 'classifiers' in info:
+                        logger.debug(f"All classifiers: {[c for c in classifiers if 'license' in c.lower()]}")
                 
                 return {
                     'license': 'Unknown',
@@ -1155,7 +1403,6 @@ class DependencyAnalyzer:
                 }
         
         except Exception as e:
-            logger = get_logger()
             logger.warning(f"PyPI API error for {package_name}: {str(e)}")
             return {
                 'license': 'Unknown',
@@ -1166,19 +1413,18 @@ class DependencyAnalyzer:
     def _get_packagist_license(self, package_name: str) -> Optional[Dict]:
         """Get license information from Packagist API."""
         try:
-            url = f"https://packagist.org/packages/{package_name}.json"
+            # Composer v2 metadata: tagged releases only, newest first, with later
+            # entries minified against earlier ones - far smaller than /packages/
+            url = f"https://repo.packagist.org/p2/{package_name}.json"
             response = self.session.get(url, timeout=5)
             
             if response.status_code == 200:
-                data = response.json()
-                package_data = data.get('package', {})
+                data = json_loads(response.content)
+                releases = (data.get('packages') or {}).get(package_name) or []
                 
-                # Get latest version info
-                versions = package_data.get('versions', {})
-                if versions:
-                    # Get the most recent stable version
-                    latest_version = next(iter(versions.values()))
-                    licenses = latest_version.get('license', [])
+                if releases:
+                    # The latest release always carries the full field set
+                    licenses = releases[0].get('license') or []
                     
                     if licenses:
                         # Join multiple licenses with " / "
@@ -1206,35 +1452,10 @@ class DependencyAnalyzer:
     
     def _get_golang_license(self, package_name: str) -> Optional[Dict]:
         """Get license information for Go packages."""
-        try:
-            # For Go packages, we can try to get license info from pkg.go.dev API
-            # pkg.go.dev provides a JSON API for package metadata
-            url = f"https://api.pkg.go.dev/v1/symbol/{package_name}@latest"
-            response = self.session.get(url, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                # This API doesn't provide license info directly
-                # For now, return Unknown for Go packages
-                return {
-                    'license': 'Unknown',
-                    'raw_license': 'Go packages license detection not implemented yet',
-                    'source': 'golang_not_implemented'
-                }
-            
-            # Alternative: could try to parse go.mod for license info
-            # or use GitHub API if the package is hosted there
-            return {
-                'license': 'Unknown',
-                'raw_license': 'pkg.go.dev API did not return data',
-                'source': 'golang_api_no_data'
-            }
-        
-        except Exception as e:
-            logger = get_logger()
-            logger.warning(f"Go package API error for {package_name}: {str(e)}")
-            return {
-                'license': 'Unknown',
-                'raw_license': f'API Error: {str(e)}',
-                'source': 'golang_error'
-            }
+        # pkg.go.dev has no license metadata in its API, so there is nothing to
+        # fetch; detection would need the module's source repo (e.g. GitHub API).
+        return {
+            'license': 'Unknown',
+            'raw_license': 'Go packages license detection not implemented yet',
+            'source': 'golang_not_implemented'
+        }
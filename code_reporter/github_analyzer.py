@@ -8,12 +8,22 @@ not provided or git commands fail.
 
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from .logger import get_logger
 from pathlib import Path
 
 
+# Worker count for the shared lookup pool
+MAX_CONCURRENT_GH_CALLS = 8
+
+# Per-repository lookups share one pool across all analyzers, which caps gh/git
+# subprocesses in flight across all threads; this stays clear of GitHub's
+# secondary rate limits when several repositories are analyzed at once
+_LOOKUP_POOL = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_GH_CALLS, thread_name_prefix='github')
+
+
 class GitHubAnalyzer:
     """Analyzes GitHub repositories using the gh CLI."""
     
@@ -21,6 +31,10 @@ class GitHubAnalyzer:
         # Verify gh CLI is available
         self._verify_gh_cli()
     
+    def _run(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """Run a gh/git command and capture its output."""
+        return subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+    
     def _verify_gh_cli(self):
         """Verify that gh CLI is available and authenticated."""
         try:
@@ -62,17 +76,25 @@ class GitHubAnalyzer:
         }
         
         try:
+            # The four lookups are independent, so run them side by side on the
+            # shared pool
+
             # Get repository metadata
-            result['metadata'] = self._get_repository_metadata(owner, repo)
+            metadata = _LOOKUP_POOL.submit(self._get_repository_metadata, owner, repo)
             
             # Get issue statistics (past month)
-            result['issues'] = self._get_issue_statistics(owner, repo)
+            issues = _LOOKUP_POOL.submit(self._get_issue_statistics, owner, repo)
             
             # Get commit statistics (past month). Prefer local git when available.
-            result['commits'] = self._get_commit_statistics(owner, repo, local_path)
+            commits = _LOOKUP_POOL.submit(self._get_commit_statistics, owner, repo, local_path)
             
             # Get contributor information
-            result['contributors'] = self._get_contributor_statistics(owner, repo)
+            contributors = _LOOKUP_POOL.submit(self._get_contributor_statistics, owner, repo)
+            
+            result['metadata'] = metadata.result()
+            result['issues'] = issues.result()
+            result['commits'] = commits.result()
+            result['contributors'] = contributors.result()
             
             result['success'] = True
             
@@ -90,7 +112,7 @@ class GitHubAnalyzer:
             '--json', 'name,description,stargazerCount,forkCount,primaryLanguage,createdAt,pushedAt,isPrivate,licenseInfo'
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+        result = self._run(cmd)
         data = json.loads(result.stdout)
         
         return {
@@ -120,7 +142,7 @@ class GitHubAnalyzer:
         ]
         
         try:
-            result = subprocess.run(cmd_created, capture_output=True, text=True, check=True, timeout=30)
+            result = self._run(cmd_created)
             issues_data = json.loads(result.stdout)
             
             # Categorize issues
@@ -138,7 +160,7 @@ class GitHubAnalyzer:
                 '--limit', '1000'
             ]
             
-            result_closed = subprocess.run(cmd_closed, capture_output=True, text=True, check=True, timeout=30)
+            result_closed = self._run(cmd_closed)
             closed_data = json.loads(result_closed.stdout)
             resolved_count = len(closed_data)
             
@@ -193,7 +215,7 @@ class GitHubAnalyzer:
                     'git', '-C', str(local_path), 'log', '--all', f'--since={one_month_ago_date}',
                     '--use-mailmap', '--pretty=format:%H\t%an'
                 ]
-                result = subprocess.run(git_cmd, capture_output=True, text=True, check=True, timeout=30)
+                result = self._run(git_cmd)
 
                 lines = [ln for ln in result.stdout.split('\n') if ln.strip()]
                 if not lines:
@@ -242,7 +264,7 @@ class GitHubAnalyzer:
         ]
 
         try:
-            result = subprocess.run(api_cmd, capture_output=True, text=True, check=True, timeout=30)
+            result = self._run(api_cmd)
 
             if not result.stdout.strip():
                 return {
@@ -297,7 +319,7 @@ class GitHubAnalyzer:
         ]
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+            result = self._run(cmd)
             
             if not result.stdout.strip():
                 return {'total': 0, 'top_contributors': []}
@@ -1,12 +1,21 @@
 """Language and framework detection functionality."""
 
-import json
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Set
-import tomli
+import tomllib
 import yaml
 
+from ._json import loads as json_loads
+
+# "major.minor" runtime version inside a constraint (">=3.10" -> "3.10")
+_MAJOR_MINOR_RE = re.compile(r'(\d+\.\d+)')
+# `go 1.21` directive in go.mod
+_GO_DIRECTIVE_RE = re.compile(r'go (\d+\.\d+)')
+# Constraint operators before a version, and the version itself
+_CONSTRAINT_PREFIX_RE = re.compile(r'^[\^\~\>\<\=\!\s]+')
+_VERSION_RE = re.compile(r'(\d+(?:\.\d+)*)')
+
 
 class LanguageDetector:
     """Detects programming languages and frameworks in repositories."""
@@ -85,8 +94,7 @@ class LanguageDetector:
             result['confidence'] += 50
             
             try:
-                with open(composer_json, 'r') as f:
-                    composer_data = json.load(f)
+                composer_data = json_loads(composer_json.read_bytes())
                 
                 # Extract PHP version requirement
                 php_version = self._extract_php_version(composer_data)
@@ -127,7 +135,7 @@ class LanguageDetector:
         
         if php_constraint:
             # Extract version number from constraint (e.g., "^8.1" -> "8.1")
-            version_match = re.search(r'(\d+\.\d+)', php_constraint)
+            version_match = _MAJOR_MINOR_RE.search(php_constraint)
             if version_match:
                 return version_match.group(1)
         
@@ -220,19 +228,19 @@ class LanguageDetector:
         if pyproject.exists():
             try:
                 with open(pyproject, 'rb') as f:
-                    data = tomli.load(f)
+                    data = tomllib.load(f)
                 
                 # Check project.requires-python
                 requires_python = data.get('project', {}).get('requires-python')
                 if requires_python:
-                    version_match = re.search(r'(\d+\.\d+)', requires_python)
+                    version_match = _MAJOR_MINOR_RE.search(requires_python)
                     if version_match:
                         return version_match.group(1)
                 
                 # Check tool.poetry.dependencies.python
                 poetry_python = data.get('tool', {}).get('poetry', {}).get('dependencies', {}).get('python')
                 if poetry_python:
-                    version_match = re.search(r'(\d+\.\d+)', poetry_python)
+                    version_match = _MAJOR_MINOR_RE.search(poetry_python)
                     if version_match:
                         return version_match.group(1)
                         
@@ -244,7 +252,7 @@ class LanguageDetector:
         if python_version_file.exists():
             try:
                 version = python_version_file.read_text().strip()
-                version_match = re.search(r'(\d+\.\d+)', version)
+                version_match = _MAJOR_MINOR_RE.search(version)
                 if version_match:
                     return version_match.group(1)
             except Exception:
@@ -313,7 +321,7 @@ class LanguageDetector:
                 content = go_mod.read_text()
                 
                 # Extract Go version
-                go_version_match = re.search(r'go (\d+\.\d+)', content)
+                go_version_match = _GO_DIRECTIVE_RE.search(content)
                 if go_version_match:
                     result['version'] = go_version_match.group(1)
                     result['confidence'] += 20
@@ -366,7 +374,7 @@ class LanguageDetector:
     def _clean_version(self, version_string: str) -> str:
         """Clean version string by removing constraint operators."""
         # Remove common version constraint prefixes
-        cleaned = re.sub(r'^[\^\~\>\<\=\!\s]+', '', version_string)
+        cleaned = _CONSTRAINT_PREFIX_RE.sub('', version_string)
         # Extract just the version number
-        version_match = re.search(r'(\d+(?:\.\d+)*)', cleaned)
+        version_match = _VERSION_RE.search(cleaned)
         return version_match.group(1) if version_match else cleaned
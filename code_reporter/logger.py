@@ -12,7 +12,7 @@ class CodeReporterLogger:
         self.verbose = verbose
         self._setup_loggers()
     
-    def _setup_loggers(self):
+    def _setup_loggers(self) -> None:
         """Set up info and debug loggers with appropriate handlers."""
         # Info logger - goes to stdout for important information
         self.info_logger = logging.getLogger('code_reporter.info')
@@ -50,19 +50,23 @@ class CodeReporterLogger:
         self.info_logger.propagate = False
         self.debug_logger.propagate = False
     
-    def info(self, message: str):
+    def is_debug_enabled(self) -> bool:
+        """Return True if debug messages will be emitted (verbose mode)."""
+        return self.debug_logger.isEnabledFor(logging.DEBUG)
+    
+    def info(self, message: str) -> None:
         """Log important information to stdout."""
         self.info_logger.info(message)
     
-    def debug(self, message: str):
+    def debug(self, message: str) -> None:
         """Log debug information to stderr (only when verbose)."""
         self.debug_logger.debug(message)
     
-    def warning(self, message: str):
+    def warning(self, message: str) -> None:
         """Log warnings to stderr."""
         self.debug_logger.warning(message)
     
-    def error(self, message: str):
+    def error(self, message: str) -> None:
         """Log errors to stderr."""
         self.debug_logger.error(message)
 
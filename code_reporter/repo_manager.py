@@ -5,7 +5,7 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from contextlib import contextmanager
 
 from .logger import get_logger
@@ -48,22 +48,37 @@ class RepositoryManager:
         Yields:
             Dict mapping repository URL to RepoInfo
         """
-        repo_info = {}
-        
         try:
-            for i, url in enumerate(repo_urls):
-                if progress_callback:
-                    progress_callback(f"Cloning {url} ({i+1}/{len(repo_urls)})")
-                
-                info = self._clone_single_repo(url)
-                repo_info[url] = info
-                
+            repo_info = {
+                info.url: info
+                for info in self.clone_repositories_streaming(repo_urls, progress_callback)
+            }
             yield repo_info
             
         finally:
             # Cleanup all temporary directories
             self.cleanup()
     
+    def clone_repositories_streaming(self, repo_urls: List[str], progress_callback=None) -> Iterator['RepoInfo']:
+        """
+        Clone repositories one at a time, yielding each as soon as it is ready.
+        
+        Unlike clone_repositories, this does not clean up after itself; the
+        caller must call cleanup() once it has finished with the clones.
+        
+        Args:
+            repo_urls: List of GitHub repository URLs
+            progress_callback: Optional callback function for progress updates
+            
+        Yields:
+            RepoInfo for each repository, in input order
+        """
+        for i, url in enumerate(repo_urls):
+            if progress_callback:
+                progress_callback(f"Cloning {url} ({i+1}/{len(repo_urls)})")
+            
+            yield self._clone_single_repo(url)
+    
     def _clone_single_repo(self, repo_url: str) -> 'RepoInfo':
         """
         Clone a single repository and return information about it.
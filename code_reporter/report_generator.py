@@ -537,8 +537,9 @@ class ReportGenerator:
                 original_name = lang.get('Name')
                 code_lines = int(lang.get('Code', 0) or 0)
                 # Apply language filter and canonicalization from config
-                if original_name and self.config.is_language_reportable(original_name):
-                    name = self.config.canonical_language(original_name) or original_name
+                reportable, name = self.config.classify(original_name)
+                if reportable:
+                    name = name or original_name
                     scc_lang_totals[name] = scc_lang_totals.get(name, 0) + code_lines
 
         if scc_lang_totals:
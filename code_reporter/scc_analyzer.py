@@ -6,6 +6,7 @@ import subprocess
 from pathlib import Path
 from typing import Dict, Optional
 
+from ._json import loads as json_loads
 from .logger import get_logger
 
 
@@ -73,7 +74,7 @@ class SCCAnalyzer:
             )
             
             # Parse JSON output
-            scc_data = json.loads(process_result.stdout)
+            scc_data = json_loads(process_result.stdout)
             
             result['success'] = True
             result['language_summary'] = scc_data.get('languageSummary', [])
@@ -3,24 +3,34 @@
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from urllib.parse import urlparse, parse_qs
 
 import requests
+from ._json import loads as json_loads
 from .logger import get_logger
 
+# Upper bound on Sentry projects queried in parallel, across all repositories
+MAX_CONCURRENT_PROJECTS = 8
+
+# Shared by every analyzer so concurrent repositories don't each add threads
+_PROJECT_POOL = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PROJECTS, thread_name_prefix='sentry')
+
 
 class SentryAnalyzer:
     """Analyzes Sentry error tracking data for projects."""
     
-    def __init__(self, auth_token: Optional[str] = None, organization_slug: Optional[str] = None):
+    def __init__(self, auth_token: Optional[str] = None, organization_slug: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize Sentry API client.
         
         Args:
             auth_token: Sentry API authentication token
             organization_slug: Sentry organization slug
+            session: Optional requests session (e.g. a cached session)
         """
         self.auth_token = auth_token or os.getenv('SENTRY_AUTH_TOKEN')
         self.organization_slug = organization_slug or os.getenv('SENTRY_ORG_SLUG')
@@ -33,7 +43,7 @@ class SentryAnalyzer:
         else:
             self.enabled = True
             
-        self.session = requests.Session()
+        self.session = session or requests.Session()
         if self.auth_token:
             self.session.headers.update({
                 'Authorization': f'Bearer {self.auth_token}',
@@ -92,8 +102,10 @@ class SentryAnalyzer:
             
             resolution_times = []
             
-            for project in projects:
-                project_data = self._analyze_project(project)
+            # Fetch per-project data concurrently; results come back in project order
+            project_results = list(_PROJECT_POOL.map(self._analyze_project, projects))
+            
+            for project, project_data in zip(projects, project_results):
                 if project_data['success']:
                     # Aggregate issue counts
                     for key in ['total', 'resolved', 'unresolved']:
@@ -190,7 +202,7 @@ class SentryAnalyzer:
             url = f"{self.base_url}/organizations/{org_slug}/projects/"
             response = self.session.get(url)
             response.raise_for_status()
-            return response.json()
+            return json_loads(response.content)
         except Exception:
             return []
     
@@ -200,7 +212,7 @@ class SentryAnalyzer:
             url = f"{self.base_url}/projects/"
             response = self.session.get(url)
             response.raise_for_status()
-            return response.json()
+            return json_loads(response.content)
         except Exception:
             return []
     
@@ -268,7 +280,7 @@ class SentryAnalyzer:
             
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            result = response.json()
+            result = json_loads(response.content)
             return result
             
         except Exception:
@@ -286,7 +298,7 @@ class SentryAnalyzer:
             
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            events = response.json()
+            events = json_loads(response.content)
             
             return {
                 'count': len(events) if isinstance(events, list) else 0,
@@ -340,13 +352,13 @@ class SentryAnalyzer:
             url = f"{self.base_url}/user/"
             response = self.session.get(url)
             response.raise_for_status()
-            user_data = response.json()
+            user_data = json_loads(response.content)
             
             # Get organizations
             orgs_url = f"{self.base_url}/organizations/"
             orgs_response = self.session.get(orgs_url)
             orgs_response.raise_for_status()
-            orgs_data = orgs_response.json()
+            orgs_data = json_loads(orgs_response.content)
             
             return {
                 'success': True,